@@ -167,12 +167,13 @@ class ResultsArea(QWidget):
         self.showing_label.hide()
         self.pagination.hide()
 
-    def show_results(self, results: list, exact_ms: int, fuzzy_ms: int):
+    def show_results(self, results: list, exact_ms: int, fuzzy_ms: int, pruned: int = 0):
         """
         Display either Exact or Fuzzy results:
         - `results`: list of Applicant to show in cards
         - `exact_ms`: execution time for exact (0 if not used)
         - `fuzzy_ms`: execution time for fuzzy (0 if not used)
+        - `pruned`: CVs skipped by top-k pruning (0 if not used)
         """
         self.clear()
         self._results = results
@@ -182,7 +183,10 @@ class ResultsArea(QWidget):
 
         self.title_label.show()
         total = self.count
-        self.infoExact.setText(f"Exact Matches: {total} CVs scanned in {exact_ms} ms")
+        exact_info = f"Exact Matches: {total} CVs scanned in {exact_ms} ms"
+        if pruned:
+            exact_info += f", {pruned} CVs pruned"
+        self.infoExact.setText(exact_info)
         self.infoExact.show()
 
         if fuzzy_ms:
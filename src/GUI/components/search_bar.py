@@ -34,12 +34,16 @@ class SearchBar(QWidget):
         self.btn_kmp = QPushButton("KMP")
         self.btn_bm  = QPushButton("Boyer-Moore")
         self.btn_ah  = QPushButton("Aho-Corasick")
-        for btn in (self.btn_kmp, self.btn_bm, self.btn_ah):
+        self.btn_wm  = QPushButton("Wu-Manber")
+        self.btn_bp  = QPushButton("Bitap")
+        self.btn_sa  = QPushButton("Suffix Array")
+        self.btn_ww  = QPushButton("Whole Word")
+        for btn in (self.btn_kmp, self.btn_bm, self.btn_ah, self.btn_wm, self.btn_bp, self.btn_sa, self.btn_ww):
             btn.setCheckable(True)
             row.addWidget(btn)
         grp = QButtonGroup(self)
         grp.setExclusive(True)
-        for b in (self.btn_kmp, self.btn_bm, self.btn_ah):
+        for b in (self.btn_kmp, self.btn_bm, self.btn_ah, self.btn_wm, self.btn_bp, self.btn_sa, self.btn_ww):
             grp.addButton(b)
         self.btn_kmp.setChecked(True)
 
@@ -58,6 +62,10 @@ class SearchBar(QWidget):
 
         lay.addLayout(row)
  
+    def set_suffix_array_available(self, available: bool, reason: str = "") -> None:
+        self.btn_sa.setEnabled(available)
+        self.btn_sa.setToolTip("" if available else reason)
+
     def _on_search(self):
         raw_kws = self.input.text().strip()
         
@@ -71,6 +79,14 @@ class SearchBar(QWidget):
             alg = "KMP"
         elif self.btn_bm.isChecked():
             alg = "Boyer-Moore"
+        elif self.btn_wm.isChecked():
+            alg = "Wu-Manber"
+        elif self.btn_bp.isChecked():
+            alg = "Bitap"
+        elif self.btn_sa.isChecked():
+            alg = "Suffix Array"
+        elif self.btn_ww.isChecked():
+            alg = "Whole Word"
         else:
             alg = "Aho-Corasick"
             
@@ -40,6 +40,9 @@ class MainWindow(QMainWindow):
         vlay.addWidget(self.title)
 
         self.search_bar = SearchBar()
+        if not self.app_state.data_manager.suffix_index_usable():
+            self.search_bar.set_suffix_array_available(
+                False, "Needs NumPy (uv sync --extra numpy) or SUFFIX_INDEX=sa|fm")
         vlay.addWidget(self.search_bar)
 
         self.results_area = ResultsArea(self, self.app_state)
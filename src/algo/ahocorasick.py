@@ -1,17 +1,56 @@
-from collections import defaultdict
+import sys
+from array import array
+from collections import deque
 import string
 
+from src.algo.double_array import DoubleArrayTrie
+
+class CharClasses(dict):
+    """Translation table mapping characters outside the alphabet to the skip column."""
+
+    def __init__(self, char_to_index, skip):
+        super().__init__({ord(ch): i for ch, i in char_to_index.items()})
+        self.skip = skip
+
+    def __missing__(self, key):
+        return self.skip
+
 class AhoCorasick:
-    def __init__(self, keywords):
+    BACKENDS = ("dense", "sparse", "double-array")
+
+    def __init__(self, keywords, backend: str = "dense"):
+        """Build the matching machine for `keywords`.
+
+        Backends:
+            dense: goto table completed into a flat DFA, one lookup per character
+            sparse: goto table searched by walking failure links
+            double-array: compact base/check trie over arbitrary Unicode characters,
+                for large keyword dictionaries that must stay resident
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}")
+
         self.words = [word.lower() for word in keywords]
+        self.lengths = [len(word) for word in self.words]
+        self.backend = backend
+        self.delta = None
+
+        if backend == "double-array":
+            self.trie = DoubleArrayTrie()
+            self.states_count = self.__build_double_array_machine()
+            return
+
         self.alphabet = string.ascii_lowercase + string.digits + string.punctuation
         self.alpha_size = len(self.alphabet)
         self.char_to_index = {ch: i for i, ch in enumerate(self.alphabet)}
         self.max_states = sum(len(w) for w in self.words) + 1
         self.goto = [[-1] * self.alpha_size for _ in range(self.max_states)]
-        self.out = [0] * self.max_states
+        self.out = [[] for _ in range(self.max_states)]
         self.fail = [-1] * self.max_states
+        self.dict_link = [-1] * self.max_states
         self.states_count = self.__build_matching_machine()
+        if backend == "dense":
+            self.delta = self.__build_transition_table()
 
     def __build_matching_machine(self):
         states = 1
@@ -25,18 +64,18 @@ class AhoCorasick:
                     self.goto[s][i] = states
                     states += 1
                 s = self.goto[s][i]
-            self.out[s] |= (1 << idx)
+            self.out[s].append(idx)
         for i in range(self.alpha_size):
             if self.goto[0][i] == -1:
                 self.goto[0][i] = 0
-        queue = []
+        queue = deque()
         for i in range(self.alpha_size):
             nxt = self.goto[0][i]
             if nxt != 0:
                 self.fail[nxt] = 0
                 queue.append(nxt)
         while queue:
-            r = queue.pop(0)
+            r = queue.popleft()
             for i in range(self.alpha_size):
                 nxt = self.goto[r][i]
                 if nxt != -1:
@@ -45,9 +84,76 @@ class AhoCorasick:
                     while self.goto[f][i] == -1:
                         f = self.fail[f]
                     self.fail[nxt] = self.goto[f][i]
-                    self.out[nxt] |= self.out[self.fail[nxt]]
+                    fail_state = self.fail[nxt]
+                    self.dict_link[nxt] = fail_state if self.out[fail_state] else self.dict_link[fail_state]
+        self.report_from = [
+            s if self.out[s] else self.dict_link[s] for s in range(states)
+        ]
         return states
 
+    def __build_transition_table(self):
+        """Compile goto and failure links into a flat deterministic transition table.
+
+        Row `s` holds `alpha_size + 1` entries: one per alphabet character and a
+        final skip column for characters outside the alphabet, which leave the
+        state unchanged. States are filled in BFS order so the row of a failure
+        target is always complete before it is copied.
+        """
+        width = self.alpha_size + 1
+        delta = array('i', [0]) * (self.states_count * width)
+        for s in range(self.states_count):
+            delta[s * width + self.alpha_size] = s
+
+        queue = deque()
+        for i in range(self.alpha_size):
+            nxt = self.goto[0][i]
+            delta[i] = nxt
+            if nxt != 0:
+                queue.append(nxt)
+        while queue:
+            r = queue.popleft()
+            row = r * width
+            fail_row = self.fail[r] * width
+            for i in range(self.alpha_size):
+                nxt = self.goto[r][i]
+                if nxt != -1:
+                    delta[row + i] = nxt
+                    queue.append(nxt)
+                else:
+                    delta[row + i] = delta[fail_row + i]
+
+        self.char_classes = CharClasses(self.char_to_index, self.alpha_size)
+        return delta
+
+    def __build_double_array_machine(self):
+        terminals, edges = self.trie.build(self.words)
+        size = self.trie.size
+
+        self.out = {}
+        for idx, state in enumerate(terminals):
+            self.out.setdefault(state, []).append(idx)
+
+        self.fail = array('i', [0]) * size
+        self.dict_link = array('i', [-1]) * size
+        for parent, code, state in edges:
+            if parent != DoubleArrayTrie.ROOT:
+                f = self.fail[parent]
+                nxt = self.trie.child(f, code)
+                while nxt == -1 and f != DoubleArrayTrie.ROOT:
+                    f = self.fail[f]
+                    nxt = self.trie.child(f, code)
+                self.fail[state] = max(nxt, DoubleArrayTrie.ROOT)
+            fail_state = self.fail[state]
+            self.dict_link[state] = fail_state if fail_state in self.out else self.dict_link[fail_state]
+
+        self.report_from = array('i', [-1]) * size
+        for state in range(size):
+            if state in self.out:
+                self.report_from[state] = state
+            elif self.trie.check[state] != DoubleArrayTrie.FREE:
+                self.report_from[state] = self.dict_link[state]
+        return size
+
     def __find_next_state(self, s, ch):
         i = self.char_to_index.get(ch)
         if i is None:
@@ -56,19 +162,88 @@ class AhoCorasick:
             s = self.fail[s]
         return self.goto[s][i]
 
+    def __report(self, counts, t, i, last_end):
+        """Count the keywords ending at text index `i`, starting from output state `t`.
+
+        Walks the output list of `t` and then its dictionary suffix links, so
+        only states that actually carry keywords are visited.
+        """
+        while t != -1:
+            for idx in self.out[t]:
+                start = i - self.lengths[idx] + 1
+                if start > last_end:
+                    counts[idx] += 1
+                    last_end = i
+            t = self.dict_link[t]
+        return last_end
+
     def search(self, text):
         s = 0
-        hits = defaultdict(int)
+        counts = [0] * len(self.words)
         last_end = -1
-        for i, raw_ch in enumerate(text):
-            ch = raw_ch.lower()
-            s = self.__find_next_state(s, ch)
-            if self.out[s] != 0:
-                for idx in range(len(self.words)):
-                    if self.out[s] & (1 << idx):
-                        w = self.words[idx]
-                        start = i - len(w) + 1
-                        if start > last_end:
-                            hits[w] += 1
-                            last_end = i
+        report_from = self.report_from
+
+        if self.backend == "double-array":
+            trie = self.trie
+            base = trie.base
+            check = trie.check
+            codes = trie.codes
+            fail = self.fail
+            size = trie.size
+            for i, ch in enumerate(text.lower()):
+                code = codes.get(ch, 0)
+                if code == 0:
+                    s = 0
+                    continue
+                while True:
+                    t = base[s] + code
+                    if t < size and check[t] == s:
+                        s = t
+                        break
+                    if s == 0:
+                        break
+                    s = fail[s]
+                if report_from[s] != -1:
+                    last_end = self.__report(counts, report_from[s], i, last_end)
+        elif self.delta is None:
+            for i, raw_ch in enumerate(text):
+                ch = raw_ch.lower()
+                s = self.__find_next_state(s, ch)
+                if report_from[s] != -1:
+                    last_end = self.__report(counts, report_from[s], i, last_end)
+        else:
+            delta = self.delta
+            width = self.alpha_size + 1
+            codes = text.lower().translate(self.char_classes).encode('latin-1')
+            for i, c in enumerate(codes):
+                s = delta[s * width + c]
+                if report_from[s] != -1:
+                    last_end = self.__report(counts, report_from[s], i, last_end)
+
+        hits = {}
+        for idx, count in enumerate(counts):
+            if count:
+                hits[self.words[idx]] = hits.get(self.words[idx], 0) + count
         return hits
+
+    def memory_usage(self) -> int:
+        """Approximate resident size in bytes of the automaton tables."""
+        if self.backend == "double-array":
+            return (
+                self.trie.memory_usage()
+                + self.fail.itemsize * len(self.fail)
+                + self.dict_link.itemsize * len(self.dict_link)
+                + self.report_from.itemsize * len(self.report_from)
+                + sys.getsizeof(self.out)
+                + sum(sys.getsizeof(ids) for ids in self.out.values())
+            )
+
+        total = sys.getsizeof(self.goto) + sum(sys.getsizeof(row) for row in self.goto)
+        # State ids above the small-int cache are separate int objects
+        total += sum(sys.getsizeof(nxt) for row in self.goto for nxt in row if nxt > 256)
+        for table in (self.out, self.fail, self.dict_link, self.report_from):
+            total += sys.getsizeof(table)
+        total += sum(sys.getsizeof(ids) for ids in self.out)
+        if self.delta is not None:
+            total += self.delta.itemsize * len(self.delta)
+        return total
@@ -0,0 +1,56 @@
+class Bitap:
+    """Bit-parallel exact matcher for many short keywords at once.
+
+    Uses the Shift-And formulation of Shift-Or: every keyword owns a run of
+    bits in one Python integer, so a single shift, OR and AND per text
+    character advance all keywords together. Bit `offset + j` of the state is
+    set when the last `j + 1` characters read equal the first `j + 1`
+    characters of the keyword stored at `offset`.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self.words = [keyword.lower() for keyword in self.keywords]
+        self.masks = {}
+        self.init_bits = 0
+        self.final_bits = 0
+        self.final_to_index = {}
+        self.__build_masks()
+
+    def __build_masks(self):
+        offset = 0
+        for idx, word in enumerate(self.words):
+            if not word:
+                continue
+            for j, ch in enumerate(word):
+                self.masks[ch] = self.masks.get(ch, 0) | (1 << (offset + j))
+            self.init_bits |= 1 << offset
+            self.final_bits |= 1 << (offset + len(word) - 1)
+            self.final_to_index[offset + len(word) - 1] = idx
+            offset += len(word)
+
+    def search(self, text):
+        masks = self.masks
+        init_bits = self.init_bits
+        final_bits = self.final_bits
+        counts = [0] * len(self.words)
+        next_allowed = [0] * len(self.words)
+
+        state = 0
+        for i, ch in enumerate(text):
+            state = ((state << 1) | init_bits) & masks.get(ch, 0)
+            found = state & final_bits
+            while found:
+                low = found & -found
+                idx = self.final_to_index[low.bit_length() - 1]
+                start = i - len(self.words[idx]) + 1
+                if start >= next_allowed[idx]:
+                    counts[idx] += 1
+                    next_allowed[idx] = i + 1
+                found ^= low
+
+        hits = {}
+        for idx, count in enumerate(counts):
+            if count:
+                hits[self.keywords[idx]] = count
+        return hits
@@ -0,0 +1,56 @@
+from typing import List, Tuple
+
+from src.algo.levenshtein import Levenshtein
+
+class BKTree:
+    """Burkhard-Keller tree over words under Levenshtein distance.
+
+    Every child edge is labelled with the distance between the child and its
+    parent. By the triangle inequality, a query within `radius` of some word
+    can only be found below edges labelled `d - radius .. d + radius`, where
+    `d` is the distance between the query and the current node.
+    """
+
+    def __init__(self):
+        self.words: List[str] = []
+        self.children: List[dict] = []  # node -> {edge distance: child node}
+        self.lev = Levenshtein("", "")
+
+    def __len__(self):
+        return len(self.words)
+
+    def add(self, word: str) -> None:
+        if not self.words:
+            self.words.append(word)
+            self.children.append({})
+            return
+
+        node = 0
+        while True:
+            distance = self.lev.compute_myers_distance(word, self.words[node])
+            if distance == 0:
+                return
+            child = self.children[node].get(distance)
+            if child is None:
+                self.children[node][distance] = len(self.words)
+                self.words.append(word)
+                self.children.append({})
+                return
+            node = child
+
+    def search(self, word: str, radius: int) -> List[Tuple[str, int]]:
+        """Return every (stored word, distance) within `radius` of `word`."""
+        if not self.words:
+            return []
+
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            distance = self.lev.compute_myers_distance(word, self.words[node])
+            if distance <= radius:
+                found.append((self.words[node], distance))
+            for edge, child in self.children[node].items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return found
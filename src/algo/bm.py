@@ -3,54 +3,87 @@ class BoyerMoore:
         self.text = text
         self.pattern = pattern
         self.last_occurence = {}
+        self.good_suffix = []
+        self.compiled_pattern = None
 
-    def find_keys(self):
-        keys = []
-        for i in range(len(self.text)):
-            if self.text[i] not in keys:
-                keys.append(self.text[i])
-        return keys
+    @classmethod
+    def compile(cls, pattern: str) -> "BoyerMoore":
+        """Build a matcher whose shift tables are computed once for `pattern`.
 
-    def generate_last_occurence(self, keys):
-        self.last_occurence = {}
-        for key in keys:
-            self.last_occurence[key] = -1
+        Both tables depend only on the pattern, so the returned instance can
+        be reused across every text of the corpus through `count`.
+        """
+        matcher = cls("", pattern)
+        matcher.preprocess()
+        return matcher
 
+    def generate_last_occurence(self):
+        self.last_occurence = {}
         for i in range(len(self.pattern)):
-            if self.pattern[i] in keys:
-                self.last_occurence[self.pattern[i]] = i
+            self.last_occurence[self.pattern[i]] = i
+
+    def generate_good_suffix(self):
+        m = len(self.pattern)
+        shift = [0] * (m + 1)
+        border_pos = [0] * (m + 1)
+
+        i = m
+        j = m + 1
+        border_pos[i] = j
+        while i > 0:
+            while j <= m and self.pattern[i - 1] != self.pattern[j - 1]:
+                if shift[j] == 0:
+                    shift[j] = j - i
+                j = border_pos[j]
+            i -= 1
+            j -= 1
+            border_pos[i] = j
+
+        j = border_pos[0]
+        for i in range(m + 1):
+            if shift[i] == 0:
+                shift[i] = j
+            if i == j:
+                j = border_pos[j]
+
+        self.good_suffix = shift
+
+    def preprocess(self):
+        self.generate_last_occurence()
+        self.generate_good_suffix()
+        self.compiled_pattern = self.pattern
 
     def boyer_moore(self):
-        if len(self.text) < len(self.pattern): return 0, -1
+        return self.count(self.text)
+
+    def count(self, text: str):
+        pattern = self.pattern
+        m = len(pattern)
+        n = len(text)
+        if m == 0 or n < m: return 0, -1
 
+        last_occurence = self.last_occurence
+        good_suffix = self.good_suffix
         i = 0
         count = 0
         found_at_pos = -1
-        while(i + len(self.pattern) <= len(self.text)):
-            j = len(self.pattern) - 1
-            while(j >= 0):
-                pos = i + j
-                if (self.text[pos] != self.pattern[j]):
-                    to_be_aligned = self.last_occurence.get(self.text[pos], -1)
-                    if (to_be_aligned == -1):
-                        pergeseran = len(self.pattern) - 1
-                    elif (to_be_aligned < j):
-                        pergeseran = len(self.pattern) - 1 - to_be_aligned
-                    elif (to_be_aligned > j):
-                        pergeseran = 1
-                    break
+        while i + m <= n:
+            j = m - 1
+            while j >= 0 and text[i + j] == pattern[j]:
                 j -= 1
 
             if j == -1:
                 found_at_pos = i
                 count += 1
-                pergeseran = len(self.pattern)
+                pergeseran = m
+            else:
+                pergeseran = max(good_suffix[j + 1], j - last_occurence.get(text[i + j], -1))
 
             i += pergeseran
 
         return count, found_at_pos
 
     def search(self):
-        keys = self.find_keys()
-        self.generate_last_occurence(keys)
+        if self.compiled_pattern != self.pattern:
+            self.preprocess()
         return self.boyer_moore()
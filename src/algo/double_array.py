@@ -0,0 +1,155 @@
+import sys
+from array import array
+from collections import Counter, deque
+
+class DoubleArrayTrie:
+    """Compact trie stored as two parallel integer arrays (base/check).
+
+    A transition from state `s` on a character with code `c` leads to state
+    `t = base[s] + c` and exists only if `check[t] == s`. Codes are assigned to
+    the characters that occur in the keywords, most frequent first, so any
+    Unicode code point is supported while keeping the arrays dense. Characters
+    that never occur in a keyword get code 0 and have no transitions.
+    """
+
+    ROOT = 0
+    FREE = -1
+
+    def __init__(self):
+        self.codes = {}
+        self.base = array('i')
+        self.check = array('i')
+        self.size = 0
+
+    def encode(self, ch: str) -> int:
+        return self.codes.get(ch, 0)
+
+    def child(self, s: int, code: int) -> int:
+        """Return the state reached from `s` on `code`, or -1 if there is no edge."""
+        t = self.base[s] + code
+        if code and t < self.size and self.check[t] == s:
+            return t
+        return -1
+
+    def build(self, words):
+        """Insert `words` and pack the trie into base/check.
+
+        Returns:
+            tuple: (terminals, edges) where `terminals[idx]` is the state at the
+            end of `words[idx]` and `edges` lists (parent, code, child) in BFS
+            order, for callers that need to derive failure links.
+        """
+        frequency = Counter(ch for word in words for ch in word)
+        self.codes = {ch: code for code, (ch, _) in enumerate(frequency.most_common(), start=1)}
+
+        # Temporary pointer trie; discarded once packed
+        children = [{}]
+        word_nodes = []
+        for word in words:
+            node = 0
+            for ch in word:
+                code = self.codes[ch]
+                nxt = children[node].get(code)
+                if nxt is None:
+                    nxt = len(children)
+                    children[node][code] = nxt
+                    children.append({})
+                node = nxt
+            word_nodes.append(node)
+
+        capacity = max(2 * len(children), len(self.codes) + 2)
+        base = array('i', [0]) * capacity
+        check = array('i', [self.FREE]) * capacity
+        check[self.ROOT] = self.ROOT
+
+        # Doubly linked list of free cells so placement only probes empty slots
+        next_free = list(range(1, capacity + 1))
+        prev_free = list(range(-1, capacity - 1))
+        next_free[-1] = -1
+        prev_free[1] = -1
+        head = 1
+        tail = capacity - 1
+
+        def grow(new_capacity):
+            nonlocal capacity, head, tail
+            extra = new_capacity - capacity
+            base.extend(array('i', [0]) * extra)
+            check.extend(array('i', [self.FREE]) * extra)
+            next_free.extend(range(capacity + 1, new_capacity + 1))
+            prev_free.extend(range(capacity - 1, new_capacity - 1))
+            next_free[-1] = -1
+            prev_free[capacity] = tail
+            if tail == -1:
+                head = capacity
+            else:
+                next_free[tail] = capacity
+            tail = new_capacity - 1
+            capacity = new_capacity
+
+        def occupy(t):
+            nonlocal head, tail
+            p, n = prev_free[t], next_free[t]
+            if p == -1:
+                head = n
+            else:
+                next_free[p] = n
+            if n == -1:
+                tail = p
+            else:
+                prev_free[n] = p
+
+        position = {0: self.ROOT}
+        edges = []
+
+        queue = deque([0])
+        while queue:
+            node = queue.popleft()
+            state = position[node]
+            labels = sorted(children[node])
+            if not labels:
+                continue
+
+            f = head
+            while True:
+                if f == -1:
+                    f = capacity
+                    grow(2 * capacity)
+                b = f - labels[0]
+                if b >= 1:
+                    if b + labels[-1] >= capacity:
+                        grow(max(2 * capacity, b + labels[-1] + 1))
+                    if all(check[b + code] == self.FREE for code in labels):
+                        break
+                f = next_free[f]
+
+            base[state] = b
+            for code in labels:
+                t = b + code
+                check[t] = state
+                occupy(t)
+                child_node = children[node][code]
+                position[child_node] = t
+                edges.append((state, code, t))
+                queue.append(child_node)
+
+        self.size = max(position.values()) + 1
+        del base[self.size:]
+        del check[self.size:]
+
+        # Leaves point past the end so every lookup from them fails the bound check
+        for node, state in position.items():
+            if not children[node]:
+                base[state] = self.size
+
+        self.base = base
+        self.check = check
+        return [position[node] for node in word_nodes], edges
+
+    def memory_usage(self) -> int:
+        """Return the size in bytes of the base/check arrays and the code table."""
+        return (
+            self.base.itemsize * len(self.base)
+            + self.check.itemsize * len(self.check)
+            + sys.getsizeof(self.codes)
+            + sum(sys.getsizeof(ch) for ch in self.codes)
+        )
@@ -0,0 +1,116 @@
+import re
+import sys
+from array import array
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional
+
+class PositionalIndex:
+    """Token -> detail_id -> positions index for whole-word and phrase queries.
+
+    Tokens are the alphanumeric runs of a clean text, so "react," and
+    "(react)" both hold the token "react". Positions are token ordinals,
+    stored per CV as an array('I') of gaps: the first entry is absolute and
+    every later one is the distance to the previous position.
+
+    A keyword is answerable when it is nothing but tokens separated by
+    spaces; anything else ("node.js", "c++") needs a substring engine.
+    """
+
+    TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, array]] = {}  # token -> {detail_id: position gaps}
+
+    def __len__(self):
+        return len(self.postings)
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        return cls.TOKEN_RE.findall(text.lower())
+
+    @classmethod
+    def phrase_tokens(cls, keyword: str) -> Optional[List[str]]:
+        """Tokens of `keyword`, or None if it cannot be answered from postings."""
+        words = keyword.lower().split()
+        tokens = cls.tokenize(keyword)
+        return tokens if tokens and tokens == words else None
+
+    def add(self, detail_id: int, text: str) -> None:
+        positions: Dict[str, List[int]] = {}
+        for position, token in enumerate(self.tokenize(text)):
+            positions.setdefault(token, []).append(position)
+
+        for token, token_positions in positions.items():
+            gaps = array('I', token_positions)
+            for i in range(len(gaps) - 1, 0, -1):
+                gaps[i] -= gaps[i - 1]
+            self.postings.setdefault(token, {})[detail_id] = gaps
+
+    def remove(self, detail_id: int, text: str) -> None:
+        for token in set(self.tokenize(text)):
+            postings = self.postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(detail_id, None)
+            if not postings:
+                del self.postings[token]
+
+    def positions(self, token: str, detail_id: int) -> List[int]:
+        return list(accumulate(self.postings[token][detail_id]))
+
+    def count(self, tokens: List[str]) -> Dict[int, int]:
+        """Non-overlapping occurrences of the phrase `tokens` per detail_id."""
+        lists = [self.postings.get(token) for token in tokens]
+        if not all(lists):
+            return {}
+
+        if len(tokens) == 1:
+            return {detail_id: len(gaps) for detail_id, gaps in lists[0].items()}
+
+        rarest = min(lists, key=len)
+        counts: Dict[int, int] = {}
+        for detail_id in rarest:
+            if not all(detail_id in postings for postings in lists):
+                continue
+            later = [set(accumulate(postings[detail_id])) for postings in lists[1:]]
+            count = 0
+            next_start = 0
+            for start in accumulate(lists[0][detail_id]):
+                if start < next_start:
+                    continue
+                if all(start + i in positions for i, positions in enumerate(later, 1)):
+                    count += 1
+                    next_start = start + len(tokens)
+            if count:
+                counts[detail_id] = count
+        return counts
+
+    def search(self, keywords: Iterable[str]) -> Dict[int, Dict[str, int]]:
+        """Per-CV whole-word counts of every answerable keyword.
+
+        Returns:
+            Dict[int, Dict[str, int]]: detail_id -> {keyword: count}
+        """
+        results: Dict[int, Dict[str, int]] = {}
+        for keyword in keywords:
+            tokens = self.phrase_tokens(keyword)
+            if tokens is None:
+                continue
+            for detail_id, count in self.count(tokens).items():
+                results.setdefault(detail_id, {})[keyword] = count
+        return results
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the postings."""
+        total = sys.getsizeof(self.postings)
+        for token, postings in self.postings.items():
+            total += sys.getsizeof(token) + sys.getsizeof(postings)
+            total += sum(sys.getsizeof(gaps) for gaps in postings.values())
+        return total
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "tokens": len(self.postings),
+            "postings": sum(len(postings) for postings in self.postings.values()),
+            "memory_bytes": self.memory_usage(),
+        }
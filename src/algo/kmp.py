@@ -3,65 +3,64 @@ class KMP:
         self.text = text
         self.pattern = pattern
         self.border_function = []
+        self.compiled_pattern = None
 
-    def generate_prefixes(self, text):
-        prefixes = []
-        for i in range(1, len(text)):
-            prefixes.append(text[:i])
-        return prefixes
+    @classmethod
+    def compile(cls, pattern: str) -> "KMP":
+        """Build a matcher whose border function is computed once for `pattern`.
 
-    def generate_suffixes(self, text):
-        suffixes = []
-        for i in range(len(text) - 1, 0, -1):
-            suffixes.append(text[i:])
-        return suffixes
-
-    def search_match(self, pattern, idx) -> int:
-        text = pattern[:idx]
-        suffixes = self.generate_suffixes(text)
-        prefixes = self.generate_prefixes(text)
-        for i in range(len(suffixes) - 1, -1, -1):
-            if suffixes[i] == prefixes[i]:
-                return i + 1
-        return 0
+        The returned instance can be reused across every text of the corpus
+        through `count`, without recomputing the border function.
+        """
+        matcher = cls("", pattern)
+        matcher.generate_border_function()
+        return matcher
 
     def generate_border_function(self):
-        self.border_function = []
-        for i in range(1, len(self.pattern)):
-            self.border_function.append(self.search_match(self.pattern, i))
-        self.border_function.append(0)
+        m = len(self.pattern)
+        self.border_function = [0] * m
+        length = 0
+        i = 1
+        while i < m:
+            if self.pattern[i] == self.pattern[length]:
+                length += 1
+                self.border_function[i] = length
+                i += 1
+            elif length != 0:
+                length = self.border_function[length - 1]
+            else:
+                self.border_function[i] = 0
+                i += 1
+        self.compiled_pattern = self.pattern
 
     def kmp(self):
-        if len(self.text) < len(self.pattern):
+        return self.count(self.text)
+
+    def count(self, text: str):
+        pattern = self.pattern
+        border = self.border_function
+        m = len(pattern)
+        n = len(text)
+        if m == 0 or n < m:
             return 0, -1
 
-        i = 0
         count = 0
         found = -1
-        while i < len(self.text):
-            j = 0
-            pergeseran = 0
-            while j < len(self.pattern):
-                pos = i + j
-                if pos >= len(self.text) or self.text[pos] != self.pattern[j]:
-                    j = self.border_function[j]
-                    if self.border_function[j] != 0:
-                        pergeseran = len(self.pattern) - j
-                    break
+        j = 0
+        for i in range(n):
+            ch = text[i]
+            while j > 0 and ch != pattern[j]:
+                j = border[j - 1]
+            if ch == pattern[j]:
                 j += 1
-
-            if pergeseran <= 0:
-                pergeseran = 1
-
-            if j == len(self.pattern):
-                found = i
-                count += 1
-                pergeseran = len(self.pattern)
-
-            i += pergeseran
+                if j == m:
+                    found = i - m + 1
+                    count += 1
+                    j = 0
 
         return count, found
 
     def search(self):
-        self.generate_border_function()
+        if self.compiled_pattern != self.pattern:
+            self.generate_border_function()
         return self.kmp()
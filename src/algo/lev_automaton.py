@@ -0,0 +1,82 @@
+from typing import Dict, List, Tuple
+
+class LevenshteinAutomaton:
+    """Lazily determinized automaton accepting every string within distance `k` of a pattern.
+
+    A state is the last DP row of the edit distance between the pattern and
+    the input read so far, with entries clamped to `k + 1`. Clamping keeps the
+    number of distinct states finite, and transitions are cached as they are
+    discovered, so repeated prefixes in a trie walk cost a dict lookup.
+    """
+
+    def __init__(self, pattern: str, k: int):
+        self.pattern = pattern
+        self.k = k
+        self.limit = k + 1
+        self.start = tuple(min(i, self.limit) for i in range(len(pattern) + 1))
+        self.transitions: Dict[Tuple[tuple, str], tuple] = {}
+
+    def step(self, state: tuple, ch: str) -> tuple:
+        key = (state, ch)
+        nxt = self.transitions.get(key)
+        if nxt is not None:
+            return nxt
+
+        limit = self.limit
+        row = [min(state[0] + 1, limit)]
+        for i, pattern_ch in enumerate(self.pattern):
+            value = state[i] + (pattern_ch != ch)
+            if state[i + 1] + 1 < value:
+                value = state[i + 1] + 1
+            if row[i] + 1 < value:
+                value = row[i] + 1
+            row.append(value if value < limit else limit)
+        nxt = tuple(row)
+        self.transitions[key] = nxt
+        return nxt
+
+    def is_match(self, state: tuple) -> bool:
+        return state[-1] <= self.k
+
+    def can_match(self, state: tuple) -> bool:
+        return min(state) <= self.k
+
+class VocabularyTrie:
+    """Character trie of vocabulary tokens; the token is stored at its terminal node."""
+
+    TOKEN = None  # key of the token in a terminal node, never a character
+
+    def __init__(self):
+        self.root: dict = {}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, token: str) -> None:
+        node = self.root
+        for ch in token:
+            node = node.setdefault(ch, {})
+        if self.TOKEN not in node:
+            node[self.TOKEN] = token
+            self.size += 1
+
+    def search(self, automaton: LevenshteinAutomaton) -> List[Tuple[str, int]]:
+        """Walk the trie with `automaton`, pruning every branch whose state is dead.
+
+        Returns:
+            List[Tuple[str, int]]: (token, distance) for every accepted token
+        """
+        found = []
+        stack = [(self.root, automaton.start)]
+        while stack:
+            node, state = stack.pop()
+            for ch, child in node.items():
+                if ch is self.TOKEN:
+                    if automaton.is_match(state):
+                        found.append((child, state[-1]))
+                    continue
+                nxt = automaton.step(state, ch)
+                if automaton.can_match(nxt):
+                    stack.append((child, nxt))
+        return found
@@ -1,11 +1,55 @@
+import re
+import sys
+from array import array
+from bisect import bisect_left
 from typing import List, Tuple
 import random
 
+try:
+    import numpy as np
+except ImportError:  # optional, only the "numpy" backend needs it
+    np = None
+
+class WordOffsets:
+    """Start/end character offsets of every word in a whitespace-normalized text.
+
+    Built once per CV so fuzzy windows can be addressed as offset pairs instead
+    of re-joining word lists for every window and every match. Only the
+    offsets are kept; windows are sliced from the text the offsets were built
+    from, which callers pass alongside.
+    """
+
+    def __init__(self, text: str):
+        self.starts = array('I')
+        self.ends = array('I')
+        for word in re.finditer(r"\S+", text):
+            self.starts.append(word.start())
+            self.ends.append(word.end())
+
+    def __len__(self):
+        return len(self.starts)
+
+    def window(self, i: int, size: int) -> Tuple[int, int]:
+        return self.starts[i], self.ends[i + size - 1]
+
 class Levenshtein:
-    def __init__(self, text: str, pattern: str):
+    BACKENDS = ("banded", "myers", "numpy")
+
+    def __init__(self, text: str, pattern: str, backend: str = "banded", offsets: WordOffsets = None,
+                 qgrams=None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}")
+        if backend == "numpy" and np is None:
+            raise ImportError("The numpy backend requires NumPy (uv sync --extra numpy)")
+
         self.text = text
         self.pattern = pattern
+        self.backend = backend
+        self.offsets = offsets
+        self.qgrams = qgrams
         self.mat = []
+        self.peq = {}
+        self.peq_pattern = None
 
     def lev(self, i: int, j: int):
         self.mat[i][j] = min(
@@ -31,26 +75,202 @@ class Levenshtein:
 
         return self.mat[len(b)][len(a)]
 
-    def compute_similarity(self, threshold: float = 80.0):
-        pattern_words = self.pattern.split()
-        text_words = self.text.split()
-        window_size = len(pattern_words)
+    def generate_peq(self, a: str):
+        self.peq = {}
+        for i, ch in enumerate(a):
+            self.peq[ch] = self.peq.get(ch, 0) | (1 << i)
+        self.peq_pattern = a
+
+    def compute_myers_distance(self, a: str, b: str) -> int:
+        """Edit distance between `a` and `b` with Myers/Hyyro bit-vectors.
+
+        Each column of the DP matrix is kept as vertical +1/-1 delta bit-vectors
+        over `a`, so one character of `b` costs a handful of integer operations
+        and no matrix is allocated. The equality masks of `a` are cached, which
+        makes repeated calls with the same pattern cheap.
+        """
+        m = len(a)
+        if m == 0:
+            return len(b)
+        if self.peq_pattern != a:
+            self.generate_peq(a)
+
+        peq = self.peq
+        mask = (1 << m) - 1
+        high = 1 << (m - 1)
+        pv = mask
+        mv = 0
+        score = m
+        for ch in b:
+            eq = peq.get(ch, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = (mv | ~(xh | pv)) & mask
+            mh = pv & xh
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+            ph = ((ph << 1) | 1) & mask
+            mh = (mh << 1) & mask
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv
+        return score
+
+    def compute_banded_distance(self, a: str, b: str, k: int) -> int:
+        """Edit distance between `a` and `b` if it is at most `k`, otherwise `k + 1`.
+
+        Only the diagonal band |row - col| <= k of the DP matrix is filled,
+        since every cell outside it already exceeds `k`, and the computation
+        stops as soon as a whole row exceeds `k`.
+        """
+        n = len(a)
+        m = len(b)
+        limit = k + 1
+        if abs(n - m) > k:
+            return limit
+
+        prev = [col if col <= k else limit for col in range(n + 1)]
+        for row in range(1, m + 1):
+            cur = [limit] * (n + 1)
+            cur[0] = row if row <= k else limit
+            row_min = cur[0]
+            ch = b[row - 1]
+            for col in range(max(1, row - k), min(n, row + k) + 1):
+                value = prev[col - 1] + (a[col - 1] != ch)
+                if prev[col] + 1 < value:
+                    value = prev[col] + 1
+                if cur[col - 1] + 1 < value:
+                    value = cur[col - 1] + 1
+                if value > limit:
+                    value = limit
+                cur[col] = value
+                if value < row_min:
+                    row_min = value
+            if row_min > k:
+                return limit
+            prev = cur
+
+        return prev[n]
+
+    @staticmethod
+    def max_distance(threshold: float, max_len: int) -> int:
+        """Largest edit distance whose similarity over `max_len` still reaches `threshold`."""
+        k = int((1 - threshold / 100) * max_len)
+        while k < max_len and (1 - (k + 1) / max_len) * 100 >= threshold:
+            k += 1
+        while k >= 0 and (1 - k / max_len) * 100 < threshold:
+            k -= 1
+        return k
+
+    @staticmethod
+    def widest_distance(threshold: float, pattern_len: int) -> int:
+        """Largest distance any window can be allowed, over every window length within reach.
+
+        Unbounded (sys.maxsize) when `threshold` <= 0, where every window matches.
+        """
+        if pattern_len == 0:
+            return 0
+        if threshold <= 0:
+            return sys.maxsize
+        k = Levenshtein.max_distance(threshold, pattern_len)
+        window_len = pattern_len + 1
+        while True:
+            window_k = Levenshtein.max_distance(threshold, window_len)
+            if window_len - pattern_len > window_k:
+                return k
+            k = window_k
+            window_len += 1
+
+    def compute_distance(self, a: str, b: str, k: int) -> int:
+        if self.backend == "banded":
+            return self.compute_banded_distance(a, b, k)
+        return self.compute_myers_distance(a, b)
+
+    def compute_batch_distances(self, a: str, windows: List[str]) -> List[int]:
+        """Edit distance between `a` and every string of `windows` in one vectorized DP.
+
+        Windows are padded into a (windows x max length) uint32 code point
+        matrix and the DP advances one window character per step for the whole
+        batch. Within a row, the insertion chain is resolved with a running
+        minimum of `row[i] - i`, so no Python loop runs over the pattern. Each
+        window's distance is read at the step equal to its own length.
+        """
+        if not windows:
+            return []
+
+        m = len(a)
+        lengths = np.fromiter((len(w) for w in windows), dtype=np.int64, count=len(windows))
+        width = int(lengths.max())
+        if width == 0:
+            return [m] * len(windows)
+
+        padded = ''.join(w.ljust(width, '\0') for w in windows)
+        codes = np.frombuffer(padded.encode('utf-32-le'), dtype=np.uint32).reshape(len(windows), width)
+        pattern = np.frombuffer(a.encode('utf-32-le'), dtype=np.uint32)
+        steps = np.arange(m + 1, dtype=np.int64)
+
+        row = np.broadcast_to(steps, (len(windows), m + 1)).copy()
+        distances = np.where(lengths == 0, m, 0)
+        for j in range(1, width + 1):
+            mismatch = pattern[None, :] != codes[:, j - 1:j]
+            cur = np.empty_like(row)
+            cur[:, 0] = j
+            cur[:, 1:] = np.minimum(row[:, 1:] + 1, row[:, :-1] + mismatch)
+            row = np.minimum.accumulate(cur - steps, axis=1) + steps
+            done = lengths == j
+            if done.any():
+                distances[done] = row[done, m]
+        return distances.tolist()
+
+    def window_similarities(self, threshold: float = 80.0) -> List[Tuple[int, str, float]]:
+        """(char_start, window, unrounded similarity) of every window reaching `threshold`."""
+        window_size = len(self.pattern.split())
+        if self.offsets is not None:
+            text, offsets = self.text, self.offsets
+        else:
+            text = ' '.join(self.text.split())
+            offsets = WordOffsets(text)
+        pattern_len = len(self.pattern)
+        limits = {}
+        candidates = []  # (start, end, max_len, k) of windows that survive the filters
         matches = []
+        if window_size == 0:
+            return matches
 
-        for i in range(len(text_words) - window_size + 1):
-            window_str = ' '.join(text_words[i:i + window_size])
-            distance = self.compute_lev_distance(self.pattern, window_str)
-            max_len = max(len(self.pattern), len(window_str))
-            similarity = (1 - distance / max_len) * 100
+        for i in range(len(offsets) - window_size + 1):
+            start, end = offsets.window(i, window_size)
+            window_len = end - start
+            max_len = max(pattern_len, window_len)
+            k = limits.get(max_len)
+            if k is None:
+                k = limits[max_len] = self.max_distance(threshold, max_len)
+            if abs(window_len - pattern_len) > k:
+                continue
+            if self.qgrams is not None:
+                required = self.qgrams.required_for(k)
+                if required > 0 and self.qgrams.shared_in(text, start, end) < required:
+                    continue
+            candidates.append((start, end, max_len, k))
+
+        if self.backend == "numpy":
+            distances = self.compute_batch_distances(self.pattern, [text[start:end] for start, end, _, _ in candidates])
+        else:
+            distances = [self.compute_distance(self.pattern, text[start:end], k) for start, end, _, k in candidates]
 
+        for (start, end, max_len, _), distance in zip(candidates, distances):
+            similarity = (1 - distance / max_len) * 100
             if similarity >= threshold:
-                char_start = len(' '.join(text_words[:i]))
-                if i > 0:
-                    char_start += 1
-                matches.append((char_start, window_str, round(similarity, 2)))
+                matches.append((start, text[start:end], similarity))
 
         return matches
 
+    def compute_similarity(self, threshold: float = 80.0):
+        return [
+            (start, window_str, round(similarity, 2))
+            for start, window_str, similarity in self.window_similarities(threshold)
+        ]
+
     def search_fuzzy_matches(self, threshold: float = 61.0):
         match_details = self.compute_similarity(threshold)
         total_count = len(match_details)
@@ -71,6 +291,30 @@ def fuzzy_match(pattern: str, text: str, threshold: float) -> bool:
     return found
 
 
+def best_similarity(pattern: str, text: str) -> float:
+    """Highest window similarity of `pattern` in `text`.
+
+    `fuzzy_match(pattern, text, t)` is True exactly when this is >= t, so
+    one score per pair answers every threshold.
+    """
+    lev = Levenshtein(text, pattern)
+    return max((similarity for _, _, similarity in lev.window_similarities(0.0)), default=float('-inf'))
+
+
+def _score_pair(pair) -> float:
+    return best_similarity(pair[0], pair[1])
+
+
+def score_pairs(data, workers: int = 1, chunksize: int = 64) -> List[float]:
+    """Best similarity of every (pattern, text, label) pair, optionally on a process pool."""
+    if workers <= 1:
+        return [_score_pair(pair) for pair in data]
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_score_pair, data, chunksize=chunksize))
+
+
 DATA: List[Tuple[str, str, bool]] = [
     ("React", "React", True),
     ("React", "Reac", True),
@@ -127,27 +371,50 @@ def f1_score_manual(y_true: List[bool], y_pred: List[bool]) -> float:
     tp = sum(1 for yt, yp in zip(y_true, y_pred) if yt and yp)
     fp = sum(1 for yt, yp in zip(y_true, y_pred) if not yt and yp)
     fn = sum(1 for yt, yp in zip(y_true, y_pred) if yt and not yp)
+    return f1_from_counts(tp, fp, fn)
+
+def f1_from_counts(tp: int, fp: int, fn: int) -> float:
     precision = tp / (tp + fp) if (tp + fp) else 0.0
     recall = tp / (tp + fn) if (tp + fn) else 0.0
     return (2 * precision * recall / (precision + recall)) if (precision + recall) else 0.0
 
-def find_best_threshold(data, k_folds=5, seed=42):
+def f1_curve(scores: List[float], labels: List[bool], thresholds) -> List[float]:
+    """F1 of `score >= t` against `labels` for every threshold t, from one sort per class."""
+    positives = sorted(score for score, label in zip(scores, labels) if label)
+    negatives = sorted(score for score, label in zip(scores, labels) if not label)
+    curve = []
+    for t in thresholds:
+        tp = len(positives) - bisect_left(positives, t)
+        fp = len(negatives) - bisect_left(negatives, t)
+        curve.append(f1_from_counts(tp, fp, len(positives) - tp))
+    return curve
+
+def make_folds(n: int, k_folds: int = 5, seed: int = 42) -> List[List[int]]:
     random.seed(seed)
-    n = len(data)
     indices = list(range(n))
     random.shuffle(indices)
     fold_size = n // k_folds
     folds = [indices[i * fold_size : (i + 1) * fold_size] for i in range(k_folds - 1)]
     folds.append(indices[(k_folds - 1) * fold_size :])
+    return folds
+
+def cross_validated_f1(scores: List[float], labels: List[bool], thresholds,
+                       k_folds: int = 5, seed: int = 42) -> List[float]:
+    """Mean validation-fold F1 per threshold over pre-computed best similarities."""
+    thresholds = list(thresholds)
+    totals = [0.0] * len(thresholds)
+    for fold in make_folds(len(scores), k_folds, seed):
+        curve = f1_curve([scores[j] for j in fold], [labels[j] for j in fold], thresholds)
+        totals = [total + f1 for total, f1 in zip(totals, curve)]
+    return [total / k_folds for total in totals]
+
+def find_best_threshold(data, k_folds=5, seed=42, scores=None, workers=1):
+    if scores is None:
+        scores = score_pairs(data, workers)
+    labels = [bool(row[2]) for row in data]
+    thresholds = range(50, 101)
     best_t, best_score = None, -1.0
-    for thresh in range(50, 101):
-        f1_scores = []
-        for i in range(k_folds):
-            val_idx = folds[i]
-            y_true = [data[j][2] for j in val_idx]
-            y_pred = [fuzzy_match(data[j][0], data[j][1], thresh) for j in val_idx]
-            f1_scores.append(f1_score_manual(y_true, y_pred))
-        avg_f1 = sum(f1_scores) / len(f1_scores)
+    for thresh, avg_f1 in zip(thresholds, cross_validated_f1(scores, labels, thresholds, k_folds, seed)):
         if avg_f1 > best_score:
             best_score, best_t = avg_f1, thresh
     return best_t, best_score
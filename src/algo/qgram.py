@@ -0,0 +1,110 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Optional
+
+from src.algo.levenshtein import Levenshtein
+
+class QGramPattern:
+    """Keyword compiled for q-gram filtering at a similarity threshold."""
+
+    def __init__(self, pattern: str, threshold: float, q: int):
+        self.pattern = pattern
+        self.q = q
+        self.counts = Counter(pattern[i:i + q] for i in range(len(pattern) - q + 1))
+        self.max_distance = Levenshtein.widest_distance(threshold, len(pattern))
+        self.required = QGramFilter.required_matches(len(pattern), self.max_distance, q)
+
+    def required_for(self, k: int) -> int:
+        return QGramFilter.required_matches(len(self.pattern), k, self.q)
+
+    def shared_in(self, text: str, start: int, end: int) -> int:
+        """Number of pattern q-grams (with multiplicity) found in text[start:end]."""
+        q = self.q
+        remaining = dict(self.counts)
+        shared = 0
+        for i in range(start, end - q + 1):
+            gram = text[i:i + q]
+            left = remaining.get(gram)
+            if left:
+                remaining[gram] = left - 1
+                shared += 1
+        return shared
+
+class QGramFilter:
+    """Per-CV q-gram count profiles used to discard CVs before any edit distance.
+
+    By the q-gram lemma, a string within edit distance k of a pattern p
+    shares at least |p| - q + 1 - k*q q-grams with it. A matching window is a
+    substring of its CV, so a CV whose profile shares fewer q-grams with p
+    cannot contain any matching window.
+    """
+
+    def __init__(self, q: int = 3):
+        self.q = q
+        self.gram_ids: Dict[str, int] = {}
+        self.profiles: Dict[int, tuple] = {}  # detail_id -> (sorted gram ids, counts)
+
+    @staticmethod
+    def required_matches(pattern_len: int, k: int, q: int) -> int:
+        return pattern_len - q + 1 - k * q
+
+    def compile(self, pattern: str, threshold: float) -> QGramPattern:
+        return QGramPattern(pattern, threshold, self.q)
+
+    def add(self, detail_id: int, text: str) -> None:
+        text = ' '.join(text.split())
+        q = self.q
+        counts = Counter(text[i:i + q] for i in range(len(text) - q + 1))
+        entries = sorted(
+            (self.gram_ids.setdefault(gram, len(self.gram_ids)), count)
+            for gram, count in counts.items()
+        )
+        ids = array('I', (gram_id for gram_id, _ in entries))
+        freqs = array('I', (count for _, count in entries))
+        self.profiles[detail_id] = (ids, freqs)
+
+    def remove(self, detail_id: int) -> None:
+        self.profiles.pop(detail_id, None)
+
+    def shared(self, detail_id: int, compiled: QGramPattern) -> int:
+        ids, freqs = self.profiles[detail_id]
+        shared = 0
+        for gram, count in compiled.counts.items():
+            gram_id = self.gram_ids.get(gram)
+            if gram_id is None:
+                continue
+            pos = bisect_left(ids, gram_id)
+            if pos < len(ids) and ids[pos] == gram_id:
+                shared += min(count, freqs[pos])
+        return shared
+
+    def max_occurrences(self, detail_id: int, pattern: str) -> Optional[int]:
+        """Upper bound on the non-overlapping occurrences of `pattern` in a CV.
+
+        Each occurrence holds every q-gram of the pattern at its own text
+        position, so the pattern cannot occur more often than its rarest
+        q-gram. None if the pattern is shorter than q or the CV is unknown.
+        """
+        q = self.q
+        if len(pattern) < q or detail_id not in self.profiles:
+            return None
+
+        ids, freqs = self.profiles[detail_id]
+        bound = None
+        for gram in {pattern[i:i + q] for i in range(len(pattern) - q + 1)}:
+            gram_id = self.gram_ids.get(gram)
+            if gram_id is None:
+                return 0
+            pos = bisect_left(ids, gram_id)
+            if pos == len(ids) or ids[pos] != gram_id:
+                return 0
+            if bound is None or freqs[pos] < bound:
+                bound = freqs[pos]
+        return bound
+
+    def may_match(self, detail_id: int, compiled: QGramPattern) -> bool:
+        """False only if no window of the CV can reach the compiled threshold."""
+        if compiled.required <= 0 or detail_id not in self.profiles:
+            return True
+        return self.shared(detail_id, compiled) >= compiled.required
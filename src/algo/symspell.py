@@ -0,0 +1,101 @@
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.algo.levenshtein import Levenshtein
+
+class SymSpell:
+    """Symmetric-delete index over vocabulary tokens.
+
+    Every token is stored under itself and all strings obtained by deleting
+    up to `max_distance` of its characters. Two strings within edit distance
+    d always share such a deletion, so a lookup only generates the deletions
+    of the query, collects the tokens stored under them and verifies each
+    candidate with the real distance.
+
+    Indexing stops once the estimated size would pass `max_bytes`; the index
+    is then marked incomplete and callers should answer from another backend.
+    """
+
+    # Rough cost of one dict slot plus one list slot on 64-bit CPython
+    ENTRY_OVERHEAD = 3 * 8 + 8
+
+    def __init__(self, max_distance: int = 2, max_bytes: Optional[int] = None):
+        self.max_distance = max_distance
+        self.max_bytes = max_bytes
+        self.tokens: List[str] = []
+        self.deletes: Dict[str, List[int]] = {}
+        self.postings_count = 0
+        self.memory = sys.getsizeof(self.deletes)
+        self.complete = True
+        self.lev = Levenshtein("", "")
+
+    @staticmethod
+    def generate_deletes(word: str, distance: int) -> Set[str]:
+        """All strings reachable from `word` by deleting at most `distance` characters."""
+        deletes = {word}
+        frontier = {word}
+        for _ in range(distance):
+            next_frontier = set()
+            for current in frontier:
+                for i in range(len(current)):
+                    candidate = current[:i] + current[i + 1:]
+                    if candidate not in deletes:
+                        next_frontier.add(candidate)
+            deletes |= next_frontier
+            frontier = next_frontier
+        return deletes
+
+    def add(self, token: str) -> bool:
+        """Index `token`, returning False if the memory cap stopped indexing."""
+        if not self.complete:
+            return False
+
+        deletes = self.generate_deletes(token, self.max_distance)
+        cost = sys.getsizeof(token) + 8
+        for delete in deletes:
+            if delete in self.deletes:
+                cost += 8
+            else:
+                cost += sys.getsizeof(delete) + sys.getsizeof([]) + self.ENTRY_OVERHEAD
+        if self.max_bytes is not None and self.memory + cost > self.max_bytes:
+            self.complete = False
+            return False
+
+        token_id = len(self.tokens)
+        self.tokens.append(token)
+        for delete in deletes:
+            self.deletes.setdefault(delete, []).append(token_id)
+        self.postings_count += len(deletes)
+        self.memory += cost
+        return True
+
+    def can_answer(self, radius: int) -> bool:
+        return self.complete and radius <= self.max_distance
+
+    def lookup(self, word: str, radius: int) -> List[Tuple[str, int]]:
+        """Return every (token, distance) within `radius` of `word`."""
+        candidates = set()
+        for delete in self.generate_deletes(word, radius):
+            candidates.update(self.deletes.get(delete, ()))
+
+        found = []
+        for token_id in candidates:
+            token = self.tokens[token_id]
+            if abs(len(token) - len(word)) > radius:
+                continue
+            distance = self.lev.compute_myers_distance(word, token)
+            if distance <= radius:
+                found.append((token, distance))
+        return found
+
+    def stats(self) -> Dict[str, int]:
+        """Index size statistics; `memory_bytes` is an estimate."""
+        return {
+            "tokens": len(self.tokens),
+            "delete_entries": len(self.deletes),
+            "postings": self.postings_count,
+            "max_distance": self.max_distance,
+            "memory_bytes": self.memory,
+            "max_bytes": self.max_bytes if self.max_bytes is not None else -1,
+            "complete": int(self.complete),
+        }
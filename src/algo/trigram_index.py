@@ -0,0 +1,108 @@
+import sys
+from array import array
+from typing import Dict, Optional, Set
+
+from src.algo.qgram import QGramFilter
+
+class TrigramIndex:
+    """Trigram -> detail_id posting lists used to narrow substring searches.
+
+    Every substring occurrence of a keyword carries all of the keyword's
+    trigrams, so only CVs present in each of those posting lists can contain
+    it. Candidates still have to be verified with an exact matcher; CVs
+    outside the candidate set are skipped without losing any match.
+
+    The index is derived from a `QGramFilter`: it shares its gram id table
+    and is filled from the CV profiles the filter has already computed, so a
+    CV's text is only split into grams once. Removal is lazy. A removed CV
+    is hidden from candidates and its postings are only dropped when stale
+    postings outnumber live ones and the lists are rebuilt from the
+    profiles. A replaced CV may keep a few stale postings until then, which
+    only ever adds candidates.
+    """
+
+    def __init__(self, qgram_filter: QGramFilter):
+        self.qgram_filter = qgram_filter
+        self.q = qgram_filter.q
+        self.postings: Dict[int, array] = {}  # gram id -> detail_ids, in insertion order
+        self.removed: Set[int] = set()  # detail_ids whose postings are stale
+        self.size = 0  # postings held, stale ones included
+        self.stale = 0
+
+    def __len__(self):
+        return len(self.postings)
+
+    def add(self, detail_id: int) -> None:
+        """Index a CV from its profile; call after `QGramFilter.add`."""
+        self.removed.discard(detail_id)
+        ids, _ = self.qgram_filter.profiles[detail_id]
+        for gram_id in ids:
+            postings = self.postings.get(gram_id)
+            if postings is None:
+                postings = self.postings[gram_id] = array('I')
+            postings.append(detail_id)
+        self.size += len(ids)
+
+    def remove(self, detail_id: int) -> None:
+        """Drop a CV; call before `QGramFilter` forgets or replaces its profile."""
+        profile = self.qgram_filter.profiles.get(detail_id)
+        if profile is None:
+            return
+        self.removed.add(detail_id)
+        self.stale += len(profile[0])
+        if self.stale * 2 > self.size:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Rebuild the posting lists from the profiles of the CVs still indexed."""
+        self.postings = {}
+        self.size = 0
+        removed = self.removed
+        self.removed = set()
+        self.stale = 0
+        for detail_id in self.qgram_filter.profiles:
+            if detail_id not in removed:
+                self.add(detail_id)
+
+    def candidates(self, keyword: str) -> Optional[Set[int]]:
+        """detail_ids whose text holds every trigram of `keyword`.
+
+        Returns:
+            Optional[Set[int]]: candidate detail_ids, or None if the keyword
+                is shorter than a trigram and every CV is a candidate
+        """
+        q = self.q
+        grams = {keyword[i:i + q] for i in range(len(keyword) - q + 1)}
+        if not grams:
+            return None
+
+        lists = []
+        for gram in grams:
+            postings = self.postings.get(self.qgram_filter.gram_ids.get(gram))
+            if postings is None:
+                return set()
+            lists.append(postings)
+        lists.sort(key=len)
+
+        found = set(lists[0])
+        for postings in lists[1:]:
+            if not found:
+                break
+            found.intersection_update(postings)
+        found -= self.removed
+        return found
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the posting lists."""
+        total = sys.getsizeof(self.postings) + sys.getsizeof(self.removed)
+        for postings in self.postings.values():
+            total += sys.getsizeof(postings)
+        return total
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "grams": len(self.postings),
+            "postings": self.size,
+            "stale_postings": self.stale,
+            "memory_bytes": self.memory_usage(),
+        }
@@ -0,0 +1,91 @@
+from collections import Counter
+from typing import Dict, Optional
+
+from src.algo.bktree import BKTree
+from src.algo.lev_automaton import LevenshteinAutomaton, VocabularyTrie
+from src.algo.levenshtein import Levenshtein
+from src.algo.symspell import SymSpell
+
+class Vocabulary:
+    """Distinct tokens of the clean corpus with per-CV postings for fuzzy lookups.
+
+    Tokens are the whitespace-separated words of each clean text, the same
+    single-word windows `Levenshtein.compute_similarity` slides over, so a
+    lookup here returns what a per-CV scan would for single-word patterns.
+
+    Backends:
+        bktree: metric-tree traversal, also the fallback of symspell
+        symspell: symmetric-delete index, used while it is complete and its
+            deletion depth covers the query radius; otherwise the BK-tree answers
+        automaton: Levenshtein automaton of the query walked over a trie of the
+            tokens, visiting only the trie region the automaton keeps alive
+    """
+
+    BACKENDS = ("bktree", "symspell", "automaton")
+
+    def __init__(self, backend: str = "bktree", symspell_distance: int = 2,
+                 symspell_max_bytes: Optional[int] = None):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}")
+
+        self.backend = backend
+        self.postings: Dict[str, Dict[int, int]] = {}  # token -> {detail_id: count}
+        self.bktree = BKTree() if backend != "automaton" else None
+        self.symspell = SymSpell(symspell_distance, symspell_max_bytes) if backend == "symspell" else None
+        self.trie = VocabularyTrie() if backend == "automaton" else None
+
+    def __len__(self):
+        return len(self.postings)
+
+    def add(self, detail_id: int, text: str) -> None:
+        for token, count in Counter(text.split()).items():
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = {}
+                if self.bktree is not None:
+                    self.bktree.add(token)
+                if self.symspell is not None:
+                    self.symspell.add(token)
+                if self.trie is not None:
+                    self.trie.add(token)
+            postings[detail_id] = count
+
+    def remove(self, detail_id: int, text: str) -> None:
+        # Tokens stay in the fuzzy indexes; lookups skip tokens with empty postings
+        for token in set(text.split()):
+            postings = self.postings.get(token)
+            if postings is not None:
+                postings.pop(detail_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        stats = {"tokens": len(self.postings)}
+        if self.bktree is not None:
+            stats["bktree_nodes"] = len(self.bktree)
+        if self.trie is not None:
+            stats["trie_tokens"] = len(self.trie)
+        if self.symspell is not None:
+            stats.update({f"symspell_{key}": value for key, value in self.symspell.stats().items()})
+        return stats
+
+    def fuzzy_lookup(self, pattern: str, threshold: float) -> Dict[int, Dict[str, int]]:
+        """Find tokens similar to `pattern` and merge their postings.
+
+        Returns:
+            Dict[int, Dict[str, int]]: detail_id -> {matched token: occurrences in that CV}
+        """
+        radius = Levenshtein.widest_distance(threshold, len(pattern))
+        if self.trie is not None:
+            candidates = self.trie.search(LevenshteinAutomaton(pattern, radius))
+        elif self.symspell is not None and self.symspell.can_answer(radius):
+            candidates = self.symspell.lookup(pattern, radius)
+        else:
+            candidates = self.bktree.search(pattern, radius)
+
+        results: Dict[int, Dict[str, int]] = {}
+        for token, distance in candidates:
+            similarity = (1 - distance / max(len(pattern), len(token))) * 100
+            if similarity < threshold:
+                continue
+            for detail_id, count in self.postings.get(token, {}).items():
+                results.setdefault(detail_id, {})[token] = count
+        return results
@@ -0,0 +1,68 @@
+class WuManber:
+    """Multi-pattern matcher that skips through text with block-based shifts.
+
+    All keywords are aligned on their first `m` characters, where `m` is the
+    length of the shortest keyword. The last `block` characters of the current
+    window select a shift from the SHIFT table; a zero shift means the block
+    ends some keyword prefix, and only the keywords hashed under that block
+    (and sharing the window prefix) are verified.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self.words = [keyword.lower() for keyword in self.keywords]
+        self.min_len = min((len(word) for word in self.words), default=0)
+        self.block = min(self.min_len, 2 if len(self.words) < 50 else 3)
+        self.shift = {}
+        self.hash = {}
+        self.prefix = []
+        if self.min_len:
+            self.__build_tables()
+
+    def __build_tables(self):
+        m = self.min_len
+        B = self.block
+        self.default_shift = m - B + 1
+        for idx, word in enumerate(self.words):
+            for q in range(B, m + 1):
+                block = word[q - B:q]
+                shift = m - q
+                if shift < self.shift.get(block, self.default_shift):
+                    self.shift[block] = shift
+            self.hash.setdefault(word[m - B:m], []).append(idx)
+            self.prefix.append(word[:B])
+
+    def search(self, text):
+        if not self.min_len:
+            return {}
+
+        m = self.min_len
+        B = self.block
+        n = len(text)
+        shift_table = self.shift
+        default_shift = self.default_shift
+        words = self.words
+        counts = [0] * len(words)
+        next_allowed = [0] * len(words)
+
+        pos = m - 1
+        while pos < n:
+            block = text[pos - B + 1:pos + 1]
+            shift = shift_table.get(block, default_shift)
+            if shift:
+                pos += shift
+                continue
+
+            start = pos - m + 1
+            prefix = text[start:start + B]
+            for idx in self.hash[block]:
+                if self.prefix[idx] == prefix and start >= next_allowed[idx] and text.startswith(words[idx], start):
+                    counts[idx] += 1
+                    next_allowed[idx] = start + len(words[idx])
+            pos += 1
+
+        hits = {}
+        for idx, count in enumerate(counts):
+            if count:
+                hits[self.keywords[idx]] = count
+        return hits
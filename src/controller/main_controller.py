@@ -3,112 +3,285 @@ import time
 from pathlib import Path
 from collections import namedtuple
 
-from src.algo.levenshtein import Levenshtein
 from src.algo.ahocorasick import AhoCorasick
+from src.algo.wumanber import WuManber
+from src.algo.bitap import Bitap
+from src.algo.kmp import KMP
+from src.algo.bm import BoyerMoore
 from src.db.models import ApplicationDetail
 from src.gui.appState import AppState
 from src.gui.components.summary_dialog import SummaryDialog
 from src.db.encryption import EncryptionManager
+from src.utils.cache import LRUCache, ResultCache
+from src.utils.ranking import TopN
+from src.utils.search_pool import scan_fuzzy, scan_multi, scan_single
 
 from PyQt6.QtGui     import QDesktopServices
 from PyQt6.QtCore    import QUrl
 
 class MainController:
+    RANKING_DEPTH = 100  # largest top_n the search bar offers
+    PRUNABLE = {"kmp", "boyer-moore", "aho-corasick", "wu-manber", "bitap"}  # engines scanning CV text
     def __init__(self, parent, results_area, app_state: AppState):
         self.results_area = results_area
         self.parent = parent
         self.app_state = app_state
         self.applicants = EncryptionManager.get_decrypted_applicants(self.app_state.db)
+        self.matcher_cache = LRUCache(max_bytes=self.app_state.matcher_cache_bytes)
+        self.result_cache = ResultCache(max_bytes=self.app_state.result_cache_bytes,
+                                        directory=self.app_state.result_cache_dir)
 
 
     def search(self, keywords, algorithm, top_n):
         algorithm = algorithm.lower()
-        extracted_texts = self.app_state.data_manager.get_extracted_texts("clean")
+        data_manager = self.app_state.data_manager
+        extracted_texts = data_manager.get_extracted_texts("clean")
 
-        start_exact = time.time()
+        # Keywords are keyed as typed: the fuzzy stage scores them with their case
+        query_key = (algorithm, tuple(keywords), self.app_state.fuzzy_threshold)
         if algorithm == "aho-corasick":
-            exact_res = self._run_aho_corasick_search(keywords, extracted_texts)
-        elif algorithm in {"kmp", "boyer-moore"}:
-            exact_res = self._run_single_keyword_search(keywords, extracted_texts, algorithm)
+            # Backends disagree on spaces, and disk entries outlive a backend change
+            query_key += (self.app_state.ahocorasick_backend,)
+        pruning = self.app_state.topk_pruning and algorithm in self.PRUNABLE
+        if pruning:
+            # A pruned ranking is only exact up to top_n
+            query_key += (top_n,)
+        start_exact = time.time()
+        ranking = self.result_cache.get(query_key, data_manager.generation, data_manager.corpus_fingerprint)
+        if ranking is not None:
+            top_results = self._get_top_details(ranking, top_n)
+            exec_time_exact = int((time.time() - start_exact) * 1000)
+            self.results_area.show_results(top_results, exact_ms=exec_time_exact, fuzzy_ms=0)
+            return
+
+        exec_time_fuzzy = 0
+        pruned = 0
+        if pruning:
+            ranker = TopN(top_n)
+            found_keywords, pruned = self._run_pruned_search(keywords, extracted_texts, algorithm, ranker)
         else:
-            raise ValueError(f"Unsupported algorithm: {algorithm}")
+            # Keep enough ranked CVs for any top_n the search bar allows, so the
+            # cached ranking can serve later top_n changes
+            ranker = TopN(max(top_n, self.RANKING_DEPTH))
+            found_keywords = set()
+            # Scanning engines run on the worker pool when SEARCH_WORKERS > 1
+            pool = data_manager.get_search_pool() if algorithm in self.PRUNABLE else None
+            exact_res = self._run_exact_search(keywords, extracted_texts.items(), algorithm, pool)
+            for position, (detail_id, matches) in enumerate(exact_res):
+                found_keywords.update(matches.keys())
+                ranker.push(sum(matches.values()), (detail_id, matches), position)
         end_exact = time.time()
         exec_time_exact = int((end_exact - start_exact) * 1000)
 
-        found_keywords = set()
-        for detail in exact_res:
-            found_keywords.update(detail.matches.keys())
-
         missing_keywords = [k for k in keywords if k not in found_keywords]
         
-        exec_time_fuzzy = 0
         if missing_keywords:
             start_fuzzy = time.time()
             fuzzy_res = self._run_fuzzy_search(missing_keywords, extracted_texts)
+            for position, (detail_id, matches) in enumerate(fuzzy_res, len(extracted_texts)):
+                ranker.push(sum(matches.values()), (detail_id, matches), position)
             end_fuzzy = time.time()
             exec_time_fuzzy = int((end_fuzzy - start_fuzzy) * 1000)
 
-            exact_res.extend(fuzzy_res)
+        ranking = ranker.ranked()
+        top_results = self._get_top_details(ranking, top_n)
+        self.result_cache.put(query_key, data_manager.generation, data_manager.corpus_fingerprint, ranking)
 
-        exact_res.sort(key=lambda detail: sum(detail.matches.values()), reverse=True)
-        top_results = exact_res[:top_n]
+        self.results_area.show_results(top_results, exact_ms=exec_time_exact, fuzzy_ms=exec_time_fuzzy,
+                                       pruned=pruned)
 
-        self.results_area.show_results(top_results, exact_ms=exec_time_exact, fuzzy_ms=exec_time_fuzzy)
+    def _run_exact_search(self, keywords, texts, algorithm, pool=None):
+        if algorithm in {"aho-corasick", "wu-manber", "bitap"}:
+            return self._run_multi_keyword_search(keywords, texts, algorithm, pool)
+        if algorithm in {"kmp", "boyer-moore"}:
+            return self._run_single_keyword_search(keywords, texts, algorithm, pool)
+        if algorithm == "suffix array":
+            return self._run_index_search(keywords, texts)
+        if algorithm == "whole word":
+            return self._run_word_search(keywords, texts)
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
 
+    def _run_pruned_search(self, keywords, extracted_texts, algorithm, ranker):
+        """Exact stage of the top-k mode.
 
-    def _run_aho_corasick_search(self, keywords, extracted_texts):
-        Detail = namedtuple("Detail", ["id", "name", "matches"])
-        results = []
+        CVs are visited by descending upper bound on their score. Once the
+        next CV's bound cannot displace the k-th entry of `ranker`, no later
+        CV can either, and the remaining CVs are never scanned for ranking.
+        They are only checked for keywords the visited CVs did not contain,
+        so the fuzzy stage runs for exactly the same keywords as a full scan.
 
-        matcher = AhoCorasick(keywords)
-        for detail_id, text in extracted_texts.items():
-            matches = matcher.search(text)
-            if matches:
-                detail = self._get_applicant_info(detail_id, matches)
-                if detail:
-                    results.append(detail)
-        return results
+        Returns:
+            tuple: (found keywords, number of CVs pruned)
+        """
+        qgram_filter = self.app_state.data_manager.qgram_filter
+        words = [keyword.lower() for keyword in keywords]
+        order = []
+        for position, (detail_id, text) in enumerate(extracted_texts.items()):
+            bounds = [self._count_bound(algorithm, qgram_filter, detail_id, text, word) for word in words]
+            order.append((-sum(bounds), position, detail_id, bounds))
+        order.sort(key=lambda entry: entry[:2])
 
-    def _run_single_keyword_search(self, keywords, extracted_texts, algorithm):
-        Detail = namedtuple("Detail", ["id", "name", "matches"])
+        visited = 0
+        def visit():
+            nonlocal visited
+            for neg_bound, position, detail_id, _ in order:
+                if neg_bound == 0 or not ranker.can_enter(-neg_bound, position):
+                    return
+                visited += 1
+                yield detail_id, extracted_texts[detail_id]
+
+        positions = {detail_id: position for _, position, detail_id, _ in order}
+        found_keywords = set()
+        for detail_id, matches in self._run_exact_search(keywords, visit(), algorithm):
+            found_keywords.update(matches.keys())
+            ranker.push(sum(matches.values()), (detail_id, matches), positions[detail_id])
+
+        missing = {keyword for keyword in keywords if keyword not in found_keywords}
+        if missing:
+            rest = (
+                (detail_id, extracted_texts[detail_id])
+                for _, _, detail_id, bounds in order[visited:]
+                if any(bound for keyword, bound in zip(keywords, bounds) if keyword in missing)
+            )
+            # Only the missing keywords are looked for, except with Aho-Corasick: its
+            # keywords share one non-overlapping match stream, so scanning for fewer
+            # of them could report matches the full scan never does
+            wanted = keywords if algorithm == "aho-corasick" else [k for k in keywords if k in missing]
+            for _, matches in self._run_exact_search(wanted, rest, algorithm):
+                found_keywords.update(matches.keys())
+                if missing <= found_keywords:
+                    break
+
+        return found_keywords, len(order) - visited
+
+    @staticmethod
+    def _count_bound(algorithm, qgram_filter, detail_id, text, word):
+        """Upper bound on the count of `word` in a CV for the chosen engine."""
+        if algorithm == "aho-corasick":
+            # Aho-Corasick matches across skipped spaces, so only the CV length bounds it
+            length = len(word.replace(' ', ''))
+            return len(text) // length if length else len(text) + 1
+        bound = qgram_filter.max_occurrences(detail_id, word)
+        if bound is None:
+            return len(text) // len(word) if word else len(text) + 1
+        return bound
+
+    def _get_top_details(self, ranking, top_n):
+        """Look up applicants for the best `top_n` ranked CVs only, skipping CVs without one."""
         results = []
+        for detail_id, matches in ranking:
+            if len(results) >= top_n:
+                break
+            detail = self._get_applicant_info(detail_id, matches)
+            if detail:
+                results.append(detail)
+        return results
 
-        if algorithm == "kmp":
-            from src.algo.kmp import KMP
-            matcher = KMP("", "")
+    def _run_multi_keyword_search(self, keywords, texts, algorithm, pool=None):
+        matcher = self._get_matcher(algorithm, tuple(keyword.lower() for keyword in keywords))
+        if algorithm == "aho-corasick":
+            # Aho-Corasick skips characters outside its alphabet (spaces), so a
+            # match need not carry the keyword's raw trigrams; scan every CV
+            candidates = None
         else:
-            from src.algo.bm import BoyerMoore
-            matcher = BoyerMoore("", "")
+            per_keyword = self._trigram_candidates(keywords).values()
+            candidates = None if None in per_keyword else set().union(*per_keyword)
+
+        if pool is not None:
+            return pool.scan_multi(matcher, keywords, candidates)
+        return scan_multi(texts, matcher, keywords, candidates)
+
+    def _run_single_keyword_search(self, keywords, texts, algorithm, pool=None):
+        matchers = {keyword: self._get_matcher(algorithm, (keyword.lower(),)) for keyword in keywords}
+        candidates = self._trigram_candidates(keywords)
+
+        if pool is not None:
+            return pool.scan_single(matchers, candidates)
+        return scan_single(texts, matchers, candidates)
+    
+    def _get_matcher(self, algorithm, words):
+        """Compiled matcher for lowercased `words`, reused across searches through the LRU cache."""
+        def build():
+            if algorithm == "aho-corasick":
+                return AhoCorasick(words, backend=self.app_state.ahocorasick_backend)
+            if algorithm == "wu-manber":
+                return WuManber(words)
+            if algorithm == "bitap":
+                return Bitap(words)
+            if algorithm == "kmp":
+                return KMP.compile(words[0])
+            return BoyerMoore.compile(words[0])
+
+        return self.matcher_cache.get_or_build((algorithm, words), build)
+
+    def _trigram_candidates(self, keywords):
+        # keyword -> detail_ids that can contain it, None when every CV can
+        trigram_index = self.app_state.data_manager.trigram_index
+        return {keyword: trigram_index.candidates(keyword.lower()) for keyword in keywords}
+
+    def _run_index_search(self, keywords, texts):
+        found = self.app_state.data_manager.get_suffix_index().search(keywords)
+        # Walk CVs in corpus order so ties rank like the scanning engines
+        for detail_id, _ in texts:
+            matches = found.get(detail_id)
+            if matches:
+                yield detail_id, matches
 
-        for detail_id, text in extracted_texts.items():
-            matcher.text = text
+    def _run_word_search(self, keywords, texts):
+        index = self.app_state.data_manager.positional_index
+        found = index.search(keywords)
+        # Keywords that are not plain words or phrases ("node.js", "c++") fall back to substring matching
+        fallback = {
+            keyword: self._get_matcher("kmp", (keyword.lower(),))
+            for keyword in keywords if index.phrase_tokens(keyword) is None
+        }
+
+        for detail_id, text in texts:
+            indexed = found.get(detail_id, {})
             matches = {}
             for keyword in keywords:
-                matcher.pattern = keyword.lower()
-                res, _ = matcher.search()
+                if keyword in fallback:
+                    res, _ = fallback[keyword].count(text)
+                else:
+                    res = indexed.get(keyword, 0)
                 if res:
                     matches[keyword] = res
             if matches:
-                detail = self._get_applicant_info(detail_id, matches)
-                if detail:
-                    results.append(detail)
-        return results
-    
+                yield detail_id, matches
+
     def _run_fuzzy_search(self, keywords, extracted_texts):
-        results = []
+        threshold = self.app_state.fuzzy_threshold
+        # Single-word keywords are answered from the vocabulary without scanning any CV
+        vocabulary = self.app_state.data_manager.vocabulary
+        lookups = {
+            keyword: vocabulary.fuzzy_lookup(keyword, threshold)
+            for keyword in keywords if len(keyword.split()) == 1
+        }
 
-        for detail_id, text in extracted_texts.items():
+        qgram_filter = self.app_state.data_manager.qgram_filter
+        qgram_patterns = {
+            keyword: qgram_filter.compile(keyword, threshold)
+            for keyword in keywords if keyword not in lookups
+        }
+
+        candidates = {
+            keyword: {detail_id for detail_id in extracted_texts if qgram_filter.may_match(detail_id, qgrams)}
+            for keyword, qgrams in qgram_patterns.items()
+        }
+        pool = self.app_state.data_manager.get_search_pool() if qgram_patterns else None
+        if pool is not None:
+            scanned = pool.scan_fuzzy(qgram_patterns, candidates, self.app_state.fuzzy_distance, threshold)
+        else:
+            scanned = scan_fuzzy(extracted_texts.items(), self.app_state.data_manager.get_word_offsets,
+                                 qgram_patterns, candidates, self.app_state.fuzzy_distance, threshold)
+
+        for detail_id in extracted_texts:
             fuzzy_matches = {}
             for keyword in keywords:
-                levenshtein = Levenshtein(text, keyword)
-                found, _, matched_dict = levenshtein.search_fuzzy_matches(threshold=80.0)
-                if found:
-                    fuzzy_matches.update(matched_dict)
+                found = lookups[keyword] if keyword in lookups else scanned[keyword]
+                fuzzy_matches.update(found.get(detail_id, {}))
             if fuzzy_matches:
-                detail = self._get_applicant_info(detail_id, fuzzy_matches)
-                if detail:
-                    results.append(detail)
-        return results
+                yield detail_id, fuzzy_matches
     
     def _get_applicant_info(self, detail_id, matches):
         Detail = namedtuple("Detail", ["id", "name", "matches"])
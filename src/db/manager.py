@@ -1,11 +1,21 @@
+import hashlib
 import os
 import shutil
 import fitz
 import random
+import time
 from pathlib import Path
 from typing import Dict, Optional
 
+from src.algo.inverted_index import PositionalIndex
+from src.algo.levenshtein import WordOffsets
+from src.algo.qgram import QGramFilter
+from src.algo.suffix_array import SuffixArrayIndex
+from src.algo.trigram_index import TrigramIndex
+from src.algo.vocabulary import Vocabulary
 from src.db.connection import DatabaseConnection
+from src.utils.search_pool import SearchPool
+from src.utils.shared_corpus import SharedCorpus
 from src.db.models import ApplicantProfile, ApplicationDetail
 
 class DataManager:
@@ -25,6 +35,21 @@ class DataManager:
         self.enable_demo = os.getenv('ENABLE_DEMO', 'false').lower() == 'true'
         self.extracted_raw_texts = {}    # Dict[int, str] - detail_id -> raw_text
         self.extracted_clean_texts = {}  # Dict[int, str] - detail_id -> clean_text
+        self.word_offsets = {}           # Dict[int, WordOffsets] - detail_id -> clean_text word offsets
+        self.generation = 0              # bumped whenever a clean_text changes
+        self.fingerprint = None          # (generation, digest of every clean_text) - see corpus_fingerprint
+        self.qgram_filter = QGramFilter()  # q-gram count profile of every clean_text
+        self.vocabulary = Vocabulary(      # clean_text tokens -> detail_id postings, with fuzzy indexes
+            backend=os.getenv('FUZZY_BACKEND', 'bktree').lower(),
+            symspell_max_bytes=int(float(os.getenv('SYMSPELL_MAX_MB', '256')) * 1024 * 1024)
+        )
+        self.positional_index = PositionalIndex()  # clean_text token -> detail_id -> positions
+        self.trigram_index = TrigramIndex(self.qgram_filter)  # clean_text trigram -> detail_ids, prefilters substring search
+        self.suffix_index_mode = os.getenv('SUFFIX_INDEX', 'off').lower()  # off | sa | fm
+        self.suffix_index = None           # SuffixArrayIndex over every clean_text, rebuilt after changes
+        self.search_workers = int(os.getenv('SEARCH_WORKERS', '0'))
+        self.search_pool = None            # SearchPool with the clean_texts sharded across workers
+        self.shared_corpus = None          # SharedCorpus - clean_texts in shared memory, read by the workers
 
     def get_pdf_files(self) -> list:
         """Get list of PDF files from data folder.
@@ -148,8 +173,7 @@ class DataManager:
 
                 filtered_text = self.filter_text(full_text)
                 if not self.enable_demo:
-                    self.extracted_raw_texts[idx + 1] = full_text
-                    self.extracted_clean_texts[idx + 1] = filtered_text
+                    self.store_texts(idx + 1, full_text, filtered_text)
 
                 else:
                     query = "SELECT detail_id FROM ApplicationDetail WHERE cv_path LIKE %s"
@@ -166,9 +190,8 @@ class DataManager:
                             # append the name instead of prepending
                             full_text = f"{full_text}\n\n{full_name}"
 
-                        self.extracted_raw_texts[detail_id] = full_text
                         filtered_text = self.filter_text(full_text)
-                        self.extracted_clean_texts[detail_id] = filtered_text
+                        self.store_texts(detail_id, full_text, filtered_text)
 
                 if self.enable_save:
                     pdf_name = pdf_file.rsplit('.', 1)[0]
@@ -191,8 +214,62 @@ class DataManager:
                 
             except Exception as e:
                 print(f"[Error] - Extracting {pdf_file}: {e}")
-                self.extracted_raw_texts[idx + 1] = ""
-                self.extracted_clean_texts[idx + 1] = ""
+                self.store_texts(idx + 1, "", "")
+
+        print(f"[Log] - Fuzzy vocabulary index: {self.vocabulary.stats()}")
+        print(f"[Log] - Positional word index: {self.positional_index.stats()}")
+        print(f"[Log] - Trigram index: {self.trigram_index.stats()}")
+
+        if self.suffix_index_mode in ('sa', 'fm'):
+            self.build_suffix_index()
+
+        if self.search_workers > 1:
+            self.get_search_pool()
+
+    def store_texts(self, detail_id: int, raw_text: str, clean_text: str) -> None:
+        """Store the raw and clean text of a CV and drop structures derived from the old text.
+        
+        Args:
+            detail_id (int): Unique detail identifier
+            raw_text (str): Text extracted from the PDF
+            clean_text (str): Filtered text used for searching
+        """
+
+        old_clean_text = self.extracted_clean_texts.get(detail_id)
+        if old_clean_text is not None:
+            self.vocabulary.remove(detail_id, old_clean_text)
+            self.positional_index.remove(detail_id, old_clean_text)
+            self.trigram_index.remove(detail_id)
+
+        self.extracted_raw_texts[detail_id] = raw_text
+        self.extracted_clean_texts[detail_id] = clean_text
+        self.generation += 1
+        self.word_offsets.pop(detail_id, None)
+        self.suffix_index = None
+        self.qgram_filter.add(detail_id, clean_text)
+        self.vocabulary.add(detail_id, clean_text)
+        self.positional_index.add(detail_id, clean_text)
+        self.trigram_index.add(detail_id)
+
+    def remove_texts(self, detail_id: int) -> None:
+        """Drop a CV's texts and its entries in every derived structure.
+        
+        Args:
+            detail_id (int): Unique detail identifier
+        """
+
+        clean_text = self.extracted_clean_texts.pop(detail_id, None)
+        self.extracted_raw_texts.pop(detail_id, None)
+        if clean_text is None:
+            return
+
+        self.generation += 1
+        self.word_offsets.pop(detail_id, None)
+        self.suffix_index = None
+        self.trigram_index.remove(detail_id)
+        self.qgram_filter.remove(detail_id)
+        self.vocabulary.remove(detail_id, clean_text)
+        self.positional_index.remove(detail_id, clean_text)
 
     def bind_pdf(self, full_text: str, pdf_file: str) -> None:
         """Bind extracted text to the database.
@@ -235,6 +312,113 @@ class DataManager:
         else:
             raise ValueError("text_type must be 'raw' or 'clean'")
         
+    def corpus_fingerprint(self) -> str:
+        """Digest of every clean text, stable across runs while the corpus is unchanged.
+        
+        Returns:
+            str: Hex digest, recomputed only after the generation changes
+        """
+
+        if self.fingerprint is None or self.fingerprint[0] != self.generation:
+            digest = hashlib.sha1()
+            for detail_id, text in sorted(self.extracted_clean_texts.items()):
+                digest.update(f"{detail_id}:{len(text)}:".encode('utf-8'))
+                digest.update(text.encode('utf-8'))
+            self.fingerprint = (self.generation, digest.hexdigest())
+        return self.fingerprint[1]
+
+    def get_word_offsets(self, detail_id: int) -> WordOffsets:
+        """Get the word offset table of a clean text, tokenizing it on first use.
+        
+        Args:
+            detail_id (int): Unique detail identifier
+            
+        Returns:
+            WordOffsets: Word start/end offsets of the clean text
+        """
+
+        offsets = self.word_offsets.get(detail_id)
+        if offsets is None:
+            offsets = WordOffsets(self.extracted_clean_texts.get(detail_id, ""))
+            self.word_offsets[detail_id] = offsets
+        return offsets
+
+    def build_suffix_index(self) -> SuffixArrayIndex:
+        """Build the suffix array (and FM-index if SUFFIX_INDEX=fm) over all clean texts.
+        
+        Returns:
+            SuffixArrayIndex: Index over the current clean texts
+        """
+
+        if not SuffixArrayIndex.VECTORIZED:
+            print("[Log] - NumPy not installed, building the suffix array with the slow pure-Python fallback")
+        start = time.perf_counter()
+        self.suffix_index = SuffixArrayIndex(self.extracted_clean_texts,
+                                             fm_index=self.suffix_index_mode == 'fm')
+        elapsed = time.perf_counter() - start
+        stats = self.suffix_index.stats()
+        print(f"[Log] - Built suffix index in {elapsed:.2f}s "
+              f"({stats['characters']} chars, {stats['memory_bytes'] / 2**20:.1f} MB)")
+        return self.suffix_index
+
+    def suffix_index_usable(self) -> bool:
+        """Whether the Suffix Array algorithm can be offered without freezing the UI.
+
+        With NumPy the index builds quickly on the first search. The pure-Python
+        build is only acceptable when SUFFIX_INDEX=sa|fm builds it after extraction.
+
+        Returns:
+            bool: True if searches will not wait on a slow index build
+        """
+
+        return SuffixArrayIndex.VECTORIZED or self.suffix_index_mode in ('sa', 'fm')
+
+    def get_suffix_index(self) -> SuffixArrayIndex:
+        """Get the suffix index, building it if texts changed since the last build.
+        
+        Returns:
+            SuffixArrayIndex: Index over the current clean texts
+        """
+
+        if self.suffix_index is None:
+            return self.build_suffix_index()
+        return self.suffix_index
+
+    def get_search_pool(self) -> Optional[SearchPool]:
+        """Get the search worker pool, reloading its shards if texts changed since the last load.
+        
+        Returns:
+            Optional[SearchPool]: Pool with the current clean texts, or None if SEARCH_WORKERS <= 1
+        """
+
+        if self.search_workers <= 1:
+            return None
+
+        if self.search_pool is None:
+            self.search_pool = SearchPool(self.search_workers)
+            print(f"[Log] - Started {self.search_workers} search workers")
+        if self.search_pool.generation != self.generation:
+            corpus = SharedCorpus.create(self.extracted_clean_texts)
+            self.search_pool.load(corpus, self.generation)
+            # Workers have detached from the previous block
+            if self.shared_corpus is not None:
+                self.shared_corpus.close()
+            self.shared_corpus = corpus
+            print(f"[Log] - Shared corpus: {len(corpus)} CVs, {corpus.memory_usage() / 2**20:.1f} MB")
+        return self.search_pool
+
+    def close_search_pool(self) -> None:
+        """Stop the search worker processes and release the shared corpus, if any were started."""
+
+        if self.search_pool is not None:
+            self.search_pool.close()
+            self.search_pool = None
+            print("[Log] - Stopped search workers")
+
+        if self.shared_corpus is not None:
+            self.shared_corpus.close()
+            self.shared_corpus = None
+
     def get_cv_path(self, detail_id: int) -> Optional[str]:
         """Retrieve CV file path by detail ID.
         
@@ -19,6 +19,13 @@ class AppState:
         self.applicant_count = int(os.getenv('APPLICANT_COUNT', 10))
         self.enable_encryption = os.getenv('ENABLE_FF3', 'false').lower() == 'true'
         self.enable_demo = os.getenv('ENABLE_DEMO', 'false').lower() == 'true'
+        self.fuzzy_distance = os.getenv('FUZZY_DISTANCE', 'banded').lower()
+        self.fuzzy_threshold = float(os.getenv('FUZZY_THRESHOLD', '80'))
+        self.ahocorasick_backend = os.getenv('AHO_CORASICK_BACKEND', 'dense').lower()
+        self.topk_pruning = os.getenv('TOPK_PRUNING', 'false').lower() == 'true'
+        self.matcher_cache_bytes = int(float(os.getenv('MATCHER_CACHE_MB', '64')) * 1024 * 1024)
+        self.result_cache_bytes = int(float(os.getenv('RESULT_CACHE_MB', '32')) * 1024 * 1024)
+        self.result_cache_dir = os.getenv('RESULT_CACHE_DIR', '') or None
 
     def run(self):
         """Execute the complete ATS setup workflow.
@@ -77,6 +84,7 @@ class AppState:
         
         try:
             self.data_manager.clear_temp()
+            self.data_manager.close_search_pool()
             self.db.close()
             print("[Log] - Database connection closed successfully.")
         except Exception as e:
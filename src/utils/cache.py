@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional
+
+def estimate_size(obj: Any) -> int:
+    """Approximate bytes held by `obj`.
+
+    Objects exposing `memory_usage()` report themselves; others are measured
+    as the object, its attributes and one level of their contents.
+    """
+    memory_usage = getattr(obj, "memory_usage", None)
+    if callable(memory_usage):
+        return memory_usage()
+
+    total = sys.getsizeof(obj)
+    for value in getattr(obj, "__dict__", {}).values():
+        total += sys.getsizeof(value)
+        if isinstance(value, dict):
+            total += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+        elif isinstance(value, (list, tuple, set)):
+            total += sum(sys.getsizeof(item) for item in value)
+    return total
+
+class LRUCache:
+    """Least-recently-used mapping bounded by an approximate byte budget.
+
+    Every entry is charged `sizeof(value)` when stored. Inserting past the
+    budget evicts from the least recently used end; a single value larger
+    than the whole budget is not cached at all.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, sizeof: Callable[[Any], int] = estimate_size):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, size)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self.sizeof(value)
+        self.pop(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self.entries[key] = (value, size)
+        self.bytes += size
+        while self.max_bytes is not None and self.bytes > self.max_bytes:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        value = build()
+        self.put(key, value)
+        return value
+
+    def pop(self, key: Hashable) -> Any:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        self.bytes -= entry[1]
+        return entry[0]
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes if self.max_bytes is not None else -1,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+class ResultCache:
+    """Search rankings cached in memory and, optionally, on disk.
+
+    Memory entries are tagged with the corpus generation they were computed
+    at and ignored once `DataManager` has moved past it. Disk entries outlive
+    the process, where generation numbers restart, so their file names are
+    derived from the query key and a fingerprint of the corpus content.
+    They are plain JSON, so a file dropped into the cache directory is only
+    ever read as data.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, directory: Optional[str] = None):
+        self.memory = LRUCache(max_bytes, sizeof=self.entry_size)
+        self.directory = Path(directory) if directory else None
+        self.disk_hits = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def entry_size(entry: tuple) -> int:
+        _, ranking = entry
+        total = sys.getsizeof(entry) + sys.getsizeof(ranking)
+        for item in ranking:
+            total += sys.getsizeof(item) + estimate_size(item[1])
+            total += sum(sys.getsizeof(key) for key in item[1])
+        return total
+
+    def path(self, key: Hashable, fingerprint: str) -> Path:
+        digest = hashlib.sha1(repr((key, fingerprint)).encode('utf-8')).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: Hashable, generation: int, fingerprint: Callable[[], str]) -> Optional[list]:
+        """Cached ranking for `key` at `generation`, or None.
+
+        Args:
+            key (Hashable): Normalized query key
+            generation (int): Current corpus generation
+            fingerprint (Callable[[], str]): Corpus content digest, only computed for disk lookups
+        """
+
+        entry = self.memory.get(key)
+        if entry is not None:
+            if entry[0] == generation:
+                return entry[1]
+            self.memory.pop(key)
+
+        if self.directory is None:
+            return None
+        try:
+            with open(self.path(key, fingerprint()), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            ranking = [(int(detail_id), dict(matches)) for detail_id, matches in entry]
+        except (OSError, ValueError, TypeError):
+            return None
+
+        self.disk_hits += 1
+        self.memory.put(key, (generation, ranking))
+        return ranking
+
+    def put(self, key: Hashable, generation: int, fingerprint: Callable[[], str], ranking: list) -> None:
+        self.memory.put(key, (generation, ranking))
+        if self.directory is None:
+            return
+
+        path = self.path(key, fingerprint())
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(ranking, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[Error] - Writing result cache {path}: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        stats = {f"memory_{key}": value for key, value in self.memory.stats().items()}
+        stats["disk_hits"] = self.disk_hits
+        return stats
@@ -0,0 +1,75 @@
+"""Fuzzy threshold calibration over a labelled dataset.
+
+Every (pattern, text) pair is scored once with its best window similarity,
+then every candidate threshold is evaluated from those cached scores.
+
+Dataset: CSV (or TSV by extension) with pattern, text, label columns; label
+is 1/0 or true/false, and a header row is skipped.
+
+Run with: uv run -m src.utils.calibrate <dataset.csv> [workers] [latency_sample]
+Without a dataset the built-in levenshtein.DATA is used.
+"""
+
+import csv
+import os
+import random
+import sys
+import time
+from typing import List, Tuple
+
+from src.algo.levenshtein import (
+    DATA, cross_validated_f1, f1_curve, fuzzy_match, score_pairs,
+)
+
+THRESHOLDS = range(50, 101)
+TRUE_LABELS = {"1", "true", "yes", "y"}
+
+def load_dataset(path: str) -> List[Tuple[str, str, bool]]:
+    delimiter = '\t' if path.endswith(('.tsv', '.tab')) else ','
+    data = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f, delimiter=delimiter):
+            if len(row) < 3:
+                continue
+            label = row[2].strip().lower()
+            if not data and label not in TRUE_LABELS and label not in {"0", "false", "no", "n"}:
+                continue  # header
+            data.append((row[0], row[1], label in TRUE_LABELS))
+    return data
+
+def measure_latency(data, thresholds, sample: int, seed: int = 42) -> List[float]:
+    """Mean fuzzy_match time in ms per threshold over a fixed sample of pairs."""
+    rng = random.Random(seed)
+    pairs = data if len(data) <= sample else rng.sample(data, sample)
+    latencies = []
+    for thresh in thresholds:
+        start = time.perf_counter()
+        for pattern, text, _ in pairs:
+            fuzzy_match(pattern, text, thresh)
+        latencies.append((time.perf_counter() - start) * 1000 / max(len(pairs), 1))
+    return latencies
+
+def main():
+    data = load_dataset(sys.argv[1]) if len(sys.argv) > 1 else DATA
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    sample = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    start = time.perf_counter()
+    scores = score_pairs(data, workers)
+    scoring_s = time.perf_counter() - start
+    print(f"Scored {len(data)} pairs on {workers} worker(s) in {scoring_s:.2f} s")
+
+    labels = [row[2] for row in data]
+    full = f1_curve(scores, labels, THRESHOLDS)
+    cross = cross_validated_f1(scores, labels, THRESHOLDS)
+    latency = measure_latency(data, THRESHOLDS, sample)
+
+    print(f"{'threshold':>9} {'F1':>7} {'CV F1':>7} {'ms/pair':>9}")
+    for thresh, f1, cv_f1, ms in zip(THRESHOLDS, full, cross, latency):
+        print(f"{thresh:>9} {f1:>7.3f} {cv_f1:>7.3f} {ms:>9.3f}")
+
+    best = max(range(len(cross)), key=lambda i: (cross[i], -i))
+    print(f"Best threshold: {THRESHOLDS[best]}%  (cross-validated F1={cross[best]:.3f})")
+
+if __name__ == "__main__":
+    main()
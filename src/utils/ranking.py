@@ -0,0 +1,33 @@
+from heapq import heappush, heapreplace
+from typing import Any, List, Optional
+
+class TopN:
+    """Bounded heap of the highest-scoring items seen so far.
+
+    Equal scores keep arrival order, so `ranked()` matches a stable sort of
+    every pushed item by descending score, truncated to `size`. Callers that
+    push out of order pass the item's `order` in the stable sort instead.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.heap: List[tuple] = []  # (score, -arrival, item); the root is the weakest kept entry
+        self.seen = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def can_enter(self, score: float, order: int) -> bool:
+        """Whether an item with this score and order would be kept."""
+        return len(self.heap) < self.size or (score, -order) > self.heap[0][:2]
+
+    def push(self, score: float, item: Any, order: Optional[int] = None) -> None:
+        entry = (score, -(self.seen if order is None else order), item)
+        self.seen += 1
+        if len(self.heap) < self.size:
+            heappush(self.heap, entry)
+        elif entry[:2] > self.heap[0][:2]:
+            heapreplace(self.heap, entry)
+
+    def ranked(self) -> List[Any]:
+        return [item for _, _, item in sorted(self.heap, key=lambda entry: entry[:2], reverse=True)]
@@ -0,0 +1,195 @@
+import multiprocessing
+import pickle
+import traceback
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from src.algo.levenshtein import Levenshtein, WordOffsets
+from src.utils.shared_corpus import SharedCorpus
+
+def scan_multi(texts: Iterable, matcher, keywords: List[str], candidates: Optional[Set[int]]):
+    """Yield (detail_id, {keyword: count}) for every CV a multi-keyword matcher hits."""
+    for detail_id, text in texts:
+        if candidates is not None and detail_id not in candidates:
+            continue
+        found = matcher.search(text)
+        # The cached matcher reports lowercased keywords; answer in the query's spelling
+        matches = {keyword: found[keyword.lower()] for keyword in keywords if keyword.lower() in found}
+        if matches:
+            yield detail_id, matches
+
+def scan_single(texts: Iterable, matchers: Dict[str, object], candidates: Dict[str, Optional[Set[int]]]):
+    """Yield (detail_id, {keyword: count}) for every CV a per-keyword matcher hits."""
+    for detail_id, text in texts:
+        matches = {}
+        for keyword, matcher in matchers.items():
+            allowed = candidates[keyword]
+            if allowed is not None and detail_id not in allowed:
+                continue
+            res, _ = matcher.count(text)
+            if res:
+                matches[keyword] = res
+        if matches:
+            yield detail_id, matches
+
+def scan_fuzzy(texts: Iterable, get_word_offsets: Callable[[int], WordOffsets], patterns: Dict[str, object],
+               candidates: Dict[str, Set[int]], backend: str, threshold: float) -> Dict[str, Dict[int, dict]]:
+    """Fuzzy-match each keyword against its q-gram candidate CVs.
+
+    Returns:
+        Dict[str, Dict[int, dict]]: keyword -> detail_id -> matched windows
+    """
+    results = {keyword: {} for keyword in patterns}
+    for detail_id, text in texts:
+        offsets = None
+        for keyword, qgrams in patterns.items():
+            if detail_id not in candidates[keyword]:
+                continue
+            if offsets is None:
+                offsets = get_word_offsets(detail_id)
+            levenshtein = Levenshtein(text, keyword, backend=backend, offsets=offsets, qgrams=qgrams)
+            found, _, matched_dict = levenshtein.search_fuzzy_matches(threshold=threshold)
+            if found:
+                results[keyword][detail_id] = matched_dict
+    return results
+
+class Shard:
+    """One worker's slice of the shared corpus, with its own word offset cache.
+
+    CV texts are decoded from the shared block as they are scanned and
+    dropped afterwards; only the byte spans and word offsets are kept per
+    worker.
+    """
+
+    def __init__(self, corpus: Optional[SharedCorpus] = None):
+        self.corpus = corpus
+        self.spans: Dict[int, tuple] = {}  # detail_id -> (start, end) in the shared block
+        if corpus is not None:
+            self.spans = {detail_id: (start, end) for detail_id, start, end in corpus.spans()}
+        self.word_offsets: Dict[int, WordOffsets] = {}
+
+    def __len__(self):
+        return len(self.spans)
+
+    def items(self, wanted: Optional[Set[int]] = None):
+        """(detail_id, text) pairs in shard order, decoding only the `wanted` CVs (all when None)."""
+        for detail_id, (start, end) in self.spans.items():
+            if wanted is None or detail_id in wanted:
+                yield detail_id, self.corpus.text(start, end)
+
+    def get_word_offsets(self, detail_id: int) -> WordOffsets:
+        offsets = self.word_offsets.get(detail_id)
+        if offsets is None:
+            offsets = self.word_offsets[detail_id] = WordOffsets(self.corpus.text(*self.spans[detail_id]))
+        return offsets
+
+    def close(self) -> None:
+        if self.corpus is not None:
+            self.corpus.close()
+            self.corpus = None
+
+def _any_candidate(candidates: Dict[str, Optional[Set[int]]]) -> Optional[Set[int]]:
+    # CVs that are a candidate for at least one keyword, None when every CV is
+    if any(allowed is None for allowed in candidates.values()):
+        return None
+    return set().union(*candidates.values())
+
+def _worker_main(conn) -> None:
+    shard = Shard()
+    while True:
+        try:
+            message = conn.recv_bytes()
+        except EOFError:
+            break
+        kind, args = pickle.loads(message)
+        if kind == "stop":
+            break
+        try:
+            if kind == "load":
+                shard.close()
+                shard = Shard(SharedCorpus.attach(*args))
+                result = len(shard)
+            elif kind == "multi":
+                result = list(scan_multi(shard.items(args[2]), *args))
+            elif kind == "single":
+                result = list(scan_single(shard.items(_any_candidate(args[1])), *args))
+            elif kind == "fuzzy":
+                result = scan_fuzzy(shard.items(_any_candidate(args[1])), shard.get_word_offsets, *args)
+            else:
+                raise ValueError(f"Unsupported task: {kind}")
+            conn.send(("ok", result))
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+    shard.close()
+
+class SearchPool:
+    """Long-lived worker processes, each scanning one contiguous shard of the clean corpus.
+
+    Workers attach to the `SharedCorpus` block once per corpus generation
+    and receive only their slice of its offset table. A query pickles its
+    compiled matchers once and sends the same payload to every worker; the
+    per-shard results come back in shard order, which is corpus order.
+    """
+
+    def __init__(self, workers: int):
+        context = multiprocessing.get_context("spawn")
+        self.workers = workers
+        self.connections = []
+        self.processes = []
+        self.generation = None
+        for _ in range(workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+    def load(self, corpus: SharedCorpus, generation: int) -> None:
+        """Point every worker at its shard of `corpus`; workers release the previous block."""
+        size = -(-len(corpus) // self.workers) * 3
+        for i, conn in enumerate(self.connections):
+            table = corpus.table[i * size:(i + 1) * size]
+            conn.send_bytes(pickle.dumps(("load", (corpus.name, table))))
+        self.collect()
+        self.generation = generation
+
+    def run(self, kind: str, *args) -> list:
+        """Send one task to every worker and return the per-shard results."""
+        payload = pickle.dumps((kind, args), protocol=pickle.HIGHEST_PROTOCOL)
+        for conn in self.connections:
+            conn.send_bytes(payload)
+        return self.collect()
+
+    def collect(self) -> list:
+        results = [conn.recv() for conn in self.connections]
+        for status, result in results:
+            if status == "error":
+                raise RuntimeError(f"Search worker failed:\n{result}")
+        return [result for _, result in results]
+
+    def scan_multi(self, matcher, keywords: List[str], candidates: Optional[Set[int]]) -> list:
+        return [hit for shard in self.run("multi", matcher, keywords, candidates) for hit in shard]
+
+    def scan_single(self, matchers: Dict[str, object], candidates: Dict[str, Optional[Set[int]]]) -> list:
+        return [hit for shard in self.run("single", matchers, candidates) for hit in shard]
+
+    def scan_fuzzy(self, patterns: Dict[str, object], candidates: Dict[str, Set[int]],
+                   backend: str, threshold: float) -> Dict[str, Dict[int, dict]]:
+        merged = {keyword: {} for keyword in patterns}
+        for shard in self.run("fuzzy", patterns, candidates, backend, threshold):
+            for keyword, found in shard.items():
+                merged[keyword].update(found)
+        return merged
+
+    def close(self) -> None:
+        for conn in self.connections:
+            try:
+                conn.send_bytes(pickle.dumps(("stop", ())))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.connections = []
+        self.processes = []
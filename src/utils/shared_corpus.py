@@ -0,0 +1,68 @@
+from array import array
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, Tuple
+
+class SharedCorpus:
+    """Clean corpus stored once in a shared memory block.
+
+    Texts are UTF-8 encoded back to back. `table` holds a flat
+    (detail_id, start, end) byte-offset triple per CV, in corpus order. The
+    owning process creates and unlinks the block; worker processes attach by
+    name and decode one CV at a time straight from the shared buffer, so no
+    worker keeps its own copy of the corpus.
+    """
+
+    ENCODING = 'utf-8'
+
+    def __init__(self, shm: shared_memory.SharedMemory, table: array, owner: bool):
+        self.shm = shm
+        self.table = table
+        self.owner = owner
+
+    @classmethod
+    def create(cls, texts: Dict[int, str]) -> "SharedCorpus":
+        encoded = [(detail_id, text.encode(cls.ENCODING)) for detail_id, text in texts.items()]
+        size = sum(len(data) for _, data in encoded)
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+
+        table = array('Q')
+        offset = 0
+        for detail_id, data in encoded:
+            end = offset + len(data)
+            shm.buf[offset:end] = data
+            table.extend((detail_id, offset, end))
+            offset = end
+        return cls(shm, table, owner=True)
+
+    @classmethod
+    def attach(cls, name: str, table: array) -> "SharedCorpus":
+        # The owner unlinks the block; attached processes must not track it
+        return cls(shared_memory.SharedMemory(name=name, track=False), table, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def __len__(self):
+        return len(self.table) // 3
+
+    def spans(self) -> Iterator[Tuple[int, int, int]]:
+        table = self.table
+        for i in range(0, len(table), 3):
+            yield table[i], table[i + 1], table[i + 2]
+
+    def text(self, start: int, end: int) -> str:
+        return str(self.shm.buf[start:end], self.ENCODING)
+
+    def items(self) -> Iterator[Tuple[int, str]]:
+        for detail_id, start, end in self.spans():
+            yield detail_id, self.text(start, end)
+
+    def memory_usage(self) -> int:
+        """Bytes of the shared block plus the offset table."""
+        return self.shm.size + self.table.itemsize * len(self.table)
+
+    def close(self) -> None:
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
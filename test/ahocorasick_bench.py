@@ -0,0 +1,51 @@
+"""
+Benchmark Aho-Corasick backends on a synthetic skill dictionary
+Run with: uv run -m test.ahocorasick_bench [term_count]
+"""
+
+import random
+import string
+import sys
+import time
+
+from src.algo.ahocorasick import AhoCorasick
+
+
+def make_terms(count, seed=42):
+    rng = random.Random(seed)
+    terms = set()
+    while len(terms) < count:
+        length = rng.randint(3, 14)
+        terms.add(''.join(rng.choice(string.ascii_lowercase) for _ in range(length)))
+    return sorted(terms)
+
+
+def make_text(terms, words=20000, seed=7):
+    rng = random.Random(seed)
+    filler = make_terms(500, seed=seed)
+    return ' '.join(rng.choice(terms) if rng.random() < 0.1 else rng.choice(filler) for _ in range(words))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    terms = make_terms(count)
+    corpus = make_text(terms)
+
+    print(f"{len(terms)} terms, {len(corpus)} chars of text")
+    print(f"{'backend':<14}{'build (s)':>12}{'memory (MB)':>14}{'search (s)':>12}{'hits':>8}")
+    for backend in ("sparse", "dense", "double-array"):
+        start = time.perf_counter()
+        matcher = AhoCorasick(terms, backend=backend)
+        build = time.perf_counter() - start
+
+        memory = matcher.memory_usage() / (1024 * 1024)
+
+        start = time.perf_counter()
+        hits = matcher.search(corpus)
+        search = time.perf_counter() - start
+
+        print(f"{backend:<14}{build:>12.3f}{memory:>14.2f}{search:>12.3f}{sum(hits.values()):>8}")
+
+
+if __name__ == "__main__":
+    main()
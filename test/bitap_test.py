@@ -0,0 +1,10 @@
+from src.algo.bitap import Bitap
+
+text = "food prep chef skills highly skilled in cooking and preparing a variety of cuisines inborn ability to explore new cooking avenues thorough understanding of sanitation needs of the kitchen operate kitchen equipment such as ovens and grills for cooking purposes maintain knowledge of all recipes so that the head chefs place can be filled in effectively in case of absenteeism summary exceptional culinary insight. knowledge of standard food preparation ability to work in a high volume environment chef in preparing exceptional meals"
+keywords = ["prep", "sql", "css", "cook"]
+
+bitap = Bitap(keywords)
+res = bitap.search(text)
+
+for keyword in keywords:
+    print(f"{keyword} occurence: {res.get(keyword, 0)}")
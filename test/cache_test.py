@@ -0,0 +1,55 @@
+import tempfile
+
+from src.algo.kmp import KMP
+from src.utils.cache import LRUCache, ResultCache
+from src.utils.ranking import TopN
+from src.utils.search_pool import scan_single
+
+texts = {
+    1: "senior python developer with django and flask experience",
+    2: "java developer, spring boot, some python scripting",
+    3: "python python python data engineer with sql and python",
+    4: "frontend engineer react typescript",
+    5: "python and java developer",
+}
+keywords = ["python", "java"]
+
+def fresh_ranking(top_n):
+    ranker = TopN(top_n)
+    matchers = {keyword: KMP.compile(keyword) for keyword in keywords}
+    candidates = {keyword: None for keyword in keywords}
+    for position, (detail_id, matches) in enumerate(scan_single(texts.items(), matchers, candidates)):
+        ranker.push(sum(matches.values()), (detail_id, matches), position)
+    return ranker.ranked()
+
+# TopN keeps what a stable sort by descending score keeps
+scores = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+ranker = TopN(4)
+for i, score in enumerate(scores):
+    ranker.push(score, i)
+expected = sorted(range(len(scores)), key=lambda i: -scores[i])[:4]
+print(f"TopN: {ranker.ranked()} (stable sort: {expected})")
+
+# LRU eviction by byte budget
+lru = LRUCache(max_bytes=30, sizeof=len)
+for key in ["a", "b", "c"]:
+    lru.put(key, key * 10)
+lru.get("b")
+lru.put("d", "d" * 10)
+print(f"LRU keys after eviction: {list(lru.entries)}, stats: {lru.stats()}")
+
+# A cache hit answers with the ranking of a fresh search, from memory and from disk
+query_key = ("kmp", tuple(keywords), 80.0)
+ranking = fresh_ranking(10)
+with tempfile.TemporaryDirectory() as directory:
+    cache = ResultCache(max_bytes=1 << 20, directory=directory)
+    cache.put(query_key, 1, lambda: "corpus", ranking)
+    cached = cache.get(query_key, 1, lambda: "corpus")
+    print(f"Memory hit matches fresh search: {cached == fresh_ranking(10)}")
+
+    restarted = ResultCache(max_bytes=1 << 20, directory=directory)
+    cached = restarted.get(query_key, 1, lambda: "corpus")
+    print(f"Disk hit matches fresh search: {cached == fresh_ranking(10)}")
+    print(f"Disk entry ignored for another corpus: {restarted.get(query_key, 2, lambda: 'other') is None}")
+
+print(f"Ranking: {ranking}")
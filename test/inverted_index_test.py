@@ -0,0 +1,19 @@
+from src.algo.inverted_index import PositionalIndex
+
+texts = {
+    1: "food prep chef skills highly skilled in cooking and preparing a variety of cuisines. knowledge of standard food preparation, kitchen equipment and food preparation",
+    2: "line cook followed all established restaurant practices and procedures. cooked food properly in the kitchen",
+}
+keywords = ["prep", "cook", "food preparation", "kitchen", "node.js"]
+
+index = PositionalIndex()
+for detail_id, text in texts.items():
+    index.add(detail_id, text)
+res = index.search(keywords)
+
+for detail_id in texts:
+    for keyword in keywords:
+        print(f"CV {detail_id} - {keyword} occurence: {res.get(detail_id, {}).get(keyword, 0)}")
+
+index.remove(2, texts[2])
+print(f"After removing CV 2: {index.search(['kitchen'])}")
@@ -0,0 +1,41 @@
+"""
+Benchmark edit distance backends on every single-word window of a sample CV
+Run with: uv run -m test.levenshtein_bench [copies]
+"""
+
+import sys
+import time
+
+from src.algo.levenshtein import Levenshtein, np
+
+text = "food prep chef skills highly skilled in cooking and preparing a variety of cuisines inborn ability to explore new cooking avenues thorough understanding of sanitation needs of the kitchen operate kitchen equipment such as ovens and grills for cooking purposes maintain knowledge of all recipes so that the head chefs place can be filled in effectively in case of absenteeism summary exceptional culinary insight. knowledge of standard food preparation ability to work in a high volume environment chef in preparing exceptional meals"
+pattern = "sanitaton"
+
+
+def main():
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    windows = (text + " ") * copies
+    windows = windows.split()
+    lev = Levenshtein("", pattern)
+    k = Levenshtein.widest_distance(80.0, len(pattern))
+
+    runs = [
+        ("scalar", lambda: [lev.compute_lev_distance(pattern, w) for w in windows]),
+        ("myers", lambda: [lev.compute_myers_distance(pattern, w) for w in windows]),
+        ("banded", lambda: [lev.compute_banded_distance(pattern, w, k) for w in windows]),
+    ]
+    if np is not None:
+        runs.append(("numpy", lambda: lev.compute_batch_distances(pattern, windows)))
+    else:
+        print("NumPy not installed, skipping the numpy backend")
+
+    print(f"{len(windows)} windows against '{pattern}'")
+    print(f"{'backend':<10}{'time (s)':>12}")
+    for name, run in runs:
+        start = time.perf_counter()
+        run()
+        print(f"{name:<10}{time.perf_counter() - start:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
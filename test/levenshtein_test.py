@@ -7,6 +7,10 @@ text = "food prep chef skills highly skilled in cooking and preparing a variety
 pattern = "skill"
 
 
+# A threshold of 0 accepts any distance instead of searching for the widest window forever
+print(f"Widest distance at threshold 0: {Levenshtein.widest_distance(0, 6)}")
+print(f"Widest distance at threshold 80: {Levenshtein.widest_distance(80, 6)}")
+
 lev = Levenshtein(text, pattern)
 
 match, similarity = lev.compute_similarity()
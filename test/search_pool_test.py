@@ -0,0 +1,49 @@
+from src.algo.kmp import KMP
+from src.algo.levenshtein import WordOffsets
+from src.algo.wumanber import WuManber
+from src.utils.search_pool import SearchPool, scan_fuzzy, scan_multi, scan_single
+from src.utils.shared_corpus import SharedCorpus
+
+texts = {
+    1: "senior python developer with django and flask experience",
+    2: "java developer, spring boot, some python scripting",
+    3: "python python python data engineer with sql and python",
+    4: "frontend engineer react typescript",
+    5: "pyton and jva developer",
+}
+keywords = ["python", "java"]
+
+if __name__ == "__main__":
+    # Workers are spawned and re-import this module, so the pool runs under the main guard
+    matchers = {keyword: KMP.compile(keyword) for keyword in keywords}
+    single_candidates = {"python": {1, 2, 3}, "java": None}
+    multi_candidates = {1, 2, 3, 5}
+    fuzzy_candidates = {"python": {2, 5}, "java": {5}}
+    offsets = {detail_id: WordOffsets(text) for detail_id, text in texts.items()}
+
+    local = {
+        "single": list(scan_single(texts.items(), matchers, single_candidates)),
+        "multi": list(scan_multi(texts.items(), WuManber(keywords), keywords, multi_candidates)),
+        "fuzzy": scan_fuzzy(texts.items(), offsets.get, {k: None for k in keywords}, fuzzy_candidates, "banded", 80.0),
+    }
+
+    pool = SearchPool(2)
+    corpus = SharedCorpus.create(texts)
+    pool.load(corpus, generation=1)
+    print(f"Shared corpus: {len(corpus)} CVs, {corpus.memory_usage()} bytes")
+    pooled = {
+        "single": pool.scan_single(matchers, single_candidates),
+        "multi": pool.scan_multi(WuManber(keywords), keywords, multi_candidates),
+        "fuzzy": pool.scan_fuzzy({k: None for k in keywords}, fuzzy_candidates, "banded", 80.0),
+    }
+    for kind in local:
+        print(f"{kind}: {pooled[kind]} (matches in-process: {pooled[kind] == local[kind]})")
+
+    texts[6] = "java and python"
+    reloaded = SharedCorpus.create(texts)
+    pool.load(reloaded, generation=2)
+    corpus.close()
+    print(f"After reload: {pool.scan_single(matchers, {'python': None, 'java': None})[-1]}")
+
+    pool.close()
+    reloaded.close()
@@ -0,0 +1,54 @@
+"""
+Benchmark the suffix array / FM-index against scanning every CV with KMP
+Run with: uv run -m test.suffix_array_bench [cv_count]
+"""
+
+import random
+import sys
+import time
+
+from src.algo.kmp import KMP
+from src.algo.suffix_array import SuffixArrayIndex
+
+WORDS = ("python java react express html css sql docker kitchen chef cook food "
+         "sanitation management team project data analysis design service customer "
+         "sales marketing engineer developer accounting finance budget report").split()
+KEYWORDS = ["python", "react", "kitchen", "project management", "customer service", "rust"]
+
+
+def make_corpus(count, seed=42):
+    rng = random.Random(seed)
+    return {i + 1: ' '.join(rng.choice(WORDS) for _ in range(rng.randint(300, 900))) for i in range(count)}
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    texts = make_corpus(count)
+
+    start = time.perf_counter()
+    matchers = [KMP.compile(keyword) for keyword in KEYWORDS]
+    expected = {}
+    for detail_id, text in texts.items():
+        for keyword, matcher in zip(KEYWORDS, matchers):
+            res, _ = matcher.count(text)
+            if res:
+                expected.setdefault(detail_id, {})[keyword] = res
+    scan_s = time.perf_counter() - start
+    print(f"{count} CVs, {sum(map(len, texts.values()))} chars, {len(KEYWORDS)} keywords")
+    print(f"KMP scan: {scan_s:.4f} s")
+
+    print(f"{'index':<8}{'build (s)':>12}{'memory (MB)':>14}{'query (s)':>12}")
+    for name, fm_index in (("sa", False), ("fm", True)):
+        start = time.perf_counter()
+        index = SuffixArrayIndex(texts, fm_index=fm_index)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = index.search(KEYWORDS)
+        query_s = time.perf_counter() - start
+        assert found == expected, f"{name} index disagrees with the KMP scan"
+        print(f"{name:<8}{build_s:>12.4f}{index.memory_usage() / 2**20:>14.2f}{query_s:>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
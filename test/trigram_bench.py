@@ -0,0 +1,79 @@
+"""
+Benchmark trigram-prefiltered substring search against a full Boyer-Moore scan
+Run with: uv run -m test.trigram_bench [cv_count]
+"""
+
+import random
+import sys
+import time
+
+from src.algo.bm import BoyerMoore
+from src.algo.qgram import QGramFilter
+from src.algo.trigram_index import TrigramIndex
+
+WORDS = ("python java javascript react express html css sql docker kitchen chef cook food "
+         "sanitation management team project data analysis design service customer "
+         "sales marketing engineer developer accounting finance budget report").split()
+RARE = ["kubernetes", "tensorflow", "sommelier", "actuarial", "blockchain"]
+KEYWORDS = ["kubernetes", "sommelier", "java", "project management", "rust"]
+
+
+def make_corpus(count, seed=42):
+    rng = random.Random(seed)
+    texts = {}
+    for i in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(40, 120))]
+        if rng.random() < 0.02:
+            words[rng.randrange(len(words))] = rng.choice(RARE)
+        texts[i + 1] = ' '.join(words)
+    return texts
+
+
+def scan(texts, matchers, candidates=None):
+    results = {}
+    for detail_id, text in texts.items():
+        for keyword, matcher in matchers.items():
+            allowed = candidates[keyword] if candidates else None
+            if allowed is not None and detail_id not in allowed:
+                continue
+            res, _ = matcher.count(text)
+            if res:
+                results.setdefault(detail_id, {})[keyword] = res
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    texts = make_corpus(count)
+    matchers = {keyword: BoyerMoore.compile(keyword) for keyword in KEYWORDS}
+    print(f"{count} CVs, {sum(map(len, texts.values()))} chars, keywords: {KEYWORDS}")
+
+    start = time.perf_counter()
+    qgram_filter = QGramFilter()
+    index = TrigramIndex(qgram_filter)
+    for detail_id, text in texts.items():
+        qgram_filter.add(detail_id, text)
+        index.add(detail_id)
+    stats = index.stats()
+    print(f"Profiles + index build: {time.perf_counter() - start:.2f} s, {stats['grams']} grams, "
+          f"{stats['memory_bytes'] / 2**20:.1f} MB")
+
+    start = time.perf_counter()
+    expected = scan(texts, matchers)
+    full_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    candidates = {keyword: index.candidates(keyword) for keyword in KEYWORDS}
+    found = scan(texts, matchers, candidates)
+    filtered_s = time.perf_counter() - start
+
+    assert found == expected, "trigram-filtered results differ from the full scan"
+    print(f"Full scan:     {full_s:.3f} s")
+    print(f"Trigram + BM:  {filtered_s:.3f} s  ({full_s / filtered_s:.1f}x)")
+    for keyword, allowed in candidates.items():
+        hits = sum(1 for matches in expected.values() if keyword in matches)
+        print(f"  {keyword!r}: {len(allowed) if allowed is not None else count} candidates, {hits} matches")
+
+
+if __name__ == "__main__":
+    main()